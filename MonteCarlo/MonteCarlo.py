@@ -1,12 +1,189 @@
-import pandas as pd
+import functools
+import json
+import math
+import os
+import time
+from statistics import NormalDist
+
 import numpy as np
 
+class Profiler:
+    '''
+    PURPOSE: Opt-in instrumentation of Die, Game and Analyzer methods, to see where time of a slow run goes.
+    While enabled, each call of an instrumented method records wall time, rows processed and bytes of
+    arrays/dataframes it produced, adds them to per method totals, and passes the call record to every hook.
+    While disabled (the default), an instrumented method costs one attribute check before running.
+    Module has one shared instance, MonteCarlo.profiler. Calls made inside worker processes are not recorded.
+    
+    INPUT
+    None
+    
+    OUTPUT
+    Profiler      Profiler class object
+    '''
+    def __init__(self):
+        '''
+        PURPOSE: Creates instance of Profiler class object, disabled, with no records and no hooks.
+
+        OUTPUT- outputs and attributes
+        self.enabled <- public attribute, True while calls are recorded
+        self.__totals <- private dict of method name to [calls, seconds, rows, bytes]
+        self.__hooks <- private list of callables given each call record
+        '''
+        self.enabled = False
+        self.__totals = {}
+        self.__hooks = []
+
+    def enable(self):
+        '''
+        PURPOSE: Starts recording calls of instrumented methods.
+        '''
+        self.enabled = True
+
+    def disable(self):
+        '''
+        PURPOSE: Stops recording calls, totals recorded so far are kept.
+        '''
+        self.enabled = False
+
+    def reset(self):
+        '''
+        PURPOSE: Drops per method totals recorded so far, hooks are kept.
+        '''
+        self.__totals = {}
+
+    def add_hook(self, hook):
+        '''
+        PURPOSE: Registers callable called after each recorded call, ex. to forward records to a metrics pipeline.
+
+        INPUT- arguments for method
+        hook <- callable taking one dict with keys 'method', 'seconds', 'rows' and 'bytes'
+        '''
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook):
+        '''
+        PURPOSE: Unregisters callable added by add_hook.
+
+        INPUT- arguments for method
+        hook <- callable previously passed to add_hook
+
+        OUTPUT- outputs and attributes
+        hook Argument Error message <- if hook passed was never added, returns "Hook entered not registered!"
+        '''
+        try:
+            assert hook in self.__hooks, "Hook entered not registered!"
+            self.__hooks.remove(hook)
+        except AssertionError as e:
+            print(e)
+
+    def _record(self, method, seconds, rows, nbytes):
+        '''
+        PURPOSE: Adds one call of method to totals and passes call record to hooks, for instrumented methods.
+        '''
+        totals = self.__totals.setdefault(method, [0, 0.0, 0, 0])
+        totals[0] += 1
+        totals[1] += seconds
+        totals[2] += rows
+        totals[3] += nbytes
+        if self.__hooks:
+            record = {'method': method, 'seconds': seconds, 'rows': rows, 'bytes': nbytes}
+            for hook in self.__hooks:
+                hook(record)
+
+    def stats(self):
+        '''
+        PURPOSE: Returns per method totals recorded so far. Time of a method includes instrumented methods it calls,
+                 ex. Game.play includes Die._roll_codes.
+
+        INPUT- self argument only, ex. profiler.stats()
+
+        OUTPUT- outputs and attributes
+        dataframe <- method named index, most total time first, with columns:
+                     calls, seconds (total wall time), seconds_per_call, rows (total rows processed),
+                     rows_per_second and bytes (total bytes of arrays/dataframes produced)
+        '''
+        import pandas as pd
+        methods = list(self.__totals)
+        totals = np.array([self.__totals[method] for method in methods], dtype=float).reshape(-1, 4)
+        calls, seconds, rows, nbytes = totals.T
+        stats_df = pd.DataFrame({'calls': calls.astype(np.int64), 'seconds': seconds,
+                                 'seconds_per_call': seconds / np.maximum(calls, 1),
+                                 'rows': rows.astype(np.int64),
+                                 'rows_per_second': np.divide(rows, seconds, out=np.zeros_like(rows), where=seconds > 0),
+                                 'bytes': nbytes.astype(np.int64)},
+                                index=pd.Index(methods, name='method'))
+        return stats_df.sort_values('seconds', ascending=False, kind='stable')
+
+
+profiler = Profiler()
+
+
+def _profiled(measure):
+    '''
+    PURPOSE: Decorator instrumenting a method for profiler. measure(result, *args, **kwargs) is given method's
+             result and arguments, returns (rows processed, output), and is only called while profiler is enabled.
+             Bytes recorded are size of output, see _nbytes.
+    '''
+    def decorate(method):
+        name = method.__qualname__
+        @functools.wraps(method)
+        def instrumented(*args, **kwargs):
+            if not profiler.enabled:
+                return method(*args, **kwargs)
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            seconds = time.perf_counter() - start
+            rows, output = measure(result, *args, **kwargs)
+            profiler._record(name, seconds, rows, _nbytes(output))
+            return result
+        return instrumented
+    return decorate
+
+
+def _nbytes(output):
+    '''
+    PURPOSE: Returns bytes held by NumPy array, dataframe, or tuple/list/dict of them, 0 for anything else.
+    '''
+    if isinstance(output, np.ndarray):
+        return output.nbytes
+    if hasattr(output, 'memory_usage'):
+        #dataframe, checked without importing pandas
+        return int(output.memory_usage(index=True).sum())
+    if isinstance(output, dict):
+        output = list(output.values())
+    if isinstance(output, (tuple, list)):
+        return sum(_nbytes(item) for item in output)
+    return 0
+
+
+def _frame_property(name):
+    '''
+    PURPOSE: Returns property for dataframe attribute name, built on first access by the builder that
+             a method stored in self._frames[name], so pandas is only imported when a dataframe is actually used.
+    '''
+    def get(self):
+        if name not in self._frames:
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+        return self._frames[name]()
+    return property(get)
+
+
+def _lazy(function, *args):
+    '''
+    PURPOSE: Returns callable computing function(*args) on first call, and same result on every later call.
+    '''
+    return functools.cache(functools.partial(function, *args))
+
+
 class Die:
     '''
     PURPOSE: Given an array of faces, creates a Die class object.
     Die class object contains the Die's faces and corresponding weights.
     Also, can random sample from the vector of faces according to weights,
-    to simulate rolling of die, and returns each roll's outcomes in list.
+    to simulate rolling of die, and returns each roll's outcomes in NumPy array.
+    Faces and weights are held in compact NumPy arrays, with sampling tables cached
+    until a weight changes.
     
     INPUT
     array    array of faces
@@ -14,26 +191,37 @@ class Die:
     OUTPUT
     Die      Die class object
     '''
+    __slots__ = ('__faces', '__weights', '__face_index', '__version', '__table', '__table_version')
+
     def __init__(self, array) :
         '''
         PURPOSE: Creates instance of Die object, by receiving argument of array of Die's faces.
         Weights of faces internally initializes as 1.0 for each face.
-        Stores both faces and weights into a Private Dataframe, to be used in other methods.
+        Stores faces and weights into private NumPy arrays, to be used in other methods.
 
         INPUT- arguments for method
         array      array of faces   
 
         OUTPUT- outputs and attributes
-        self.__faces_weights <- private attribute/dataframe with Die object's faces and weights
-                                to be used in other Die class methods.
+        self.__faces <- private NumPy array with Die object's faces
+        self.__weights <- private NumPy float array with weight of each face
+        self.__face_index <- private dict of face to its position in self.__faces,
+                             for constant time weight updates.
+        self.__version <- private counter, incremented each time a weight changes.
         '''
-        weights = np.array([1.0 for elem in array])
-        self.__faces_weights = pd.DataFrame({'faces': array , 'weights': weights})
+        self.__faces = np.array(array)
+        self.__weights = np.ones(len(self.__faces))
+        self.__face_index = {}
+        for i, face in enumerate(self.__faces.tolist()):
+            self.__face_index.setdefault(face, i)
+        self.__version = 0
+        self.__table = None
+        self.__table_version = -1
     
     def change_wt(self, face, new_weight):
         '''
         PURPOSE: Given face in instantiated Die object and desired weight for face,
-        updates Die's dataframe for faces and weights accordingly.
+        updates Die's weights accordingly.
 
         INPUT- arguments for method
         face <- face in instantiated Die object
@@ -46,50 +234,220 @@ class Die:
         
         new_weight Argument Error message <- if new_weight passed is not a float and cannot be converted to float, 
                                              returns "New Weight is not float, and can't be converted to float"
+                                             if new_weight is negative, nan or infinite,
+                                             returns "New Weight must be finite and not negative!"
                                        
-        self.__faces_weights <- private attribute/dataframe updated with new_weight for face argument
+        self.__weights <- private attribute/array updated with new_weight for face argument
         '''
         try:
-            assert face in list(self.__faces_weights['faces'][:]), "Face entered not in Die!"
-            type(float(new_weight))== float
-            self.__faces_weights.loc[self.__faces_weights['faces'] == face, 'weights'] = float(new_weight)
+            assert face in self.__face_index, "Face entered not in Die!"
+            new_weight = float(new_weight)
+            assert math.isfinite(new_weight) and new_weight >= 0, "New Weight must be finite and not negative!"
+            self.__weights[self.__face_index[face]] = new_weight
+            self.__version += 1
         except AssertionError as e:
             print(e)
-        except ValueError:
+        except (ValueError, TypeError):
             print("New Weight is not float, and can't be converted to float")
             
-    def roll_die(self, num_rolls=1):
+    @_profiled(lambda result, self, *args, **kwargs: (len(result), result))
+    def roll_die(self, num_rolls=1, seed=None):
         '''
-        PURPOSE: Given number of rolls, returns outcome of each roll in list.
-                 Roll is simulated by random sample of face vector according to weights.
+        PURPOSE: Given number of rolls, returns outcome of each roll in NumPy array.
+                 Rolls are simulated in one batch from the Die's cached alias table,
+                 instead of sampling the face vector once per roll.
                  Does not internally store results.
 
         INPUT- arguments for method
         num_rolls <- number of rolls, defaults to number of rolls = 1
+        seed <- optional int seed or numpy Generator, same seed reproduces same outcomes.
+                defaults to None, fresh random outcomes each call.
            
         OUTPUT- outputs and attributes
-        allrolls <- face outcome of each roll in list
+        allrolls <- face outcome of each roll in NumPy array
         '''
-        allfaces = self.__faces_weights['faces']
-        allweights = self.__faces_weights['weights']
-        allrolls = []
-        while num_rolls>0:
-            allrolls.append(list(allfaces.sample(weights = allweights))[0])
-            num_rolls+=-1
-        return allrolls
-    
+        return self.__faces[self._roll_codes(num_rolls, np.random.default_rng(seed))]
+
+    @_profiled(lambda result, self, *args, **kwargs: (len(result), result))
+    def _roll_codes(self, num_rolls, rng):
+        '''
+        PURPOSE: Batch sampling engine used by roll_die and Game class.
+                 Returns position of rolled face in Die's faces for each roll.
+
+        INPUT- arguments for method
+        num_rolls <- number of rolls
+        rng <- numpy Generator supplying the random draws
+
+        OUTPUT- outputs and attributes
+        codes <- NumPy integer array of face positions, one per roll
+        '''
+        return _sample_alias(self._sampling_table(), num_rolls, rng)
+
+    def _sampling_table(self):
+        '''
+        PURPOSE: Returns Die's normalized probabilities and alias table.
+                 Tables are built lazily and reused until change_wt updates a weight.
+
+        INPUT- self argument only
+
+        OUTPUT- outputs and attributes
+        self.__table <- private tuple (probabilities, alias cutoffs, alias faces) of NumPy arrays
+        '''
+        if self.__table_version != self.__version:
+            self.__table = _build_alias(self.__weights)
+            self.__table_version = self.__version
+        return self.__table
+
+    def _faces(self):
+        '''
+        PURPOSE: Returns Die's private NumPy array of faces, for use by Game class.
+        '''
+        return self.__faces
+
+    def _weights(self):
+        '''
+        PURPOSE: Returns Die's private NumPy array of weights, for use by Game class.
+        '''
+        return self.__weights
+
+    def _set_weights(self, weights):
+        '''
+        PURPOSE: Replaces all of Die's weights at once, ex. when Game class loads saved dice.
+        '''
+        self.__weights = np.array(weights, dtype=float)
+        self.__version += 1
+
     def current_die(self):
         '''
         PURPOSE: Method returns Die class object's most current dataframe of faces and associated weights.
+                 Dataframe is built on demand from the private arrays.
 
         INPUT- self argument only, ex. die_object.current_die()
 
         OUTPUT- outputs and attributes
-        self.__faces_weights <- returns current private attribute/dataframe,
-                                if applicable with updates made by change_wt method.
+        dataframe <- faces and weights columns,
+                     if applicable with updates made by change_wt method.
         '''
-        return self.__faces_weights
+        import pandas as pd
+        return pd.DataFrame({'faces': self.__faces, 'weights': self.__weights.copy()})
+
+
+def _build_alias(weights):
+    '''
+    PURPOSE: Builds Vose alias table from array of weights, so each roll costs
+             one uniform face pick and one coin flip regardless of number of faces.
+
+    INPUT- arguments for function
+    weights <- NumPy float array of face weights
+
+    OUTPUT- outputs and attributes
+    ValueError <- if a weight is negative, nan or infinite, or weights sum to 0
+    (probs, cutoffs, aliases) <- normalized probabilities, per face cutoff for keeping face,
+                                 and face to roll instead when cutoff not met.
+    '''
+    if not np.isfinite(weights).all() or (weights < 0).any() or not weights.sum() > 0:
+        raise ValueError("Die weights must be finite, not negative, and sum to more than 0!")
+    probs = weights / weights.sum()
+    num_faces = len(probs)
+    scaled = probs * num_faces
+    cutoffs = np.ones(num_faces)
+    aliases = np.arange(num_faces)
+    small = [i for i in range(num_faces) if scaled[i] < 1.0]
+    large = [i for i in range(num_faces) if scaled[i] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        cutoffs[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] = scaled[more] + scaled[less] - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+    #leftovers are 1.0 up to float rounding, cutoff stays 1.0
+    return probs, cutoffs, aliases
+
+
+def _sample_alias(table, num_rolls, rng):
+    '''
+    PURPOSE: Draws num_rolls face positions from alias table built by _build_alias.
+    '''
+    probs, cutoffs, aliases = table
+    picks = rng.integers(len(probs), size=num_rolls)
+    return np.where(rng.random(num_rolls) < cutoffs[picks], picks, aliases[picks])
+
+
+#rolls are drawn in fixed size blocks, each from its own child seed,
+#so results for a seed don't depend on how rolls are chunked or split up
+_BLOCK_ROLLS = 2 ** 16
+
+
+def _seed_sequence(seed):
+    '''
+    PURPOSE: Converts seed argument (None, int, SeedSequence or numpy Generator) into numpy SeedSequence.
+    '''
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        return np.random.SeedSequence(int(seed.integers(2 ** 63)))
+    return np.random.SeedSequence(seed)
+
+
+def _child_seed(seed_seq, index):
+    '''
+    PURPOSE: Returns index-th child SeedSequence of seed_seq, same child as seed_seq.spawn would give,
+             without changing seed_seq's spawn counter.
+    '''
+    return np.random.SeedSequence(seed_seq.entropy, spawn_key=seed_seq.spawn_key + (index,))
+
+
+def _block_rngs(total_rolls, seed_seq, blocks=None):
+    '''
+    PURPOSE: Yields (start, stop, rng) for each block of rolls, rng seeded by block's child of seed_seq.
 
+    INPUT- arguments for function
+    total_rolls <- total rolls in play event
+    seed_seq <- numpy SeedSequence of play event
+    blocks <- optional range of block numbers to yield, defaults to all blocks of play event
+
+    OUTPUT- outputs and attributes
+    generator <- roll positions start:stop covered by block and numpy Generator for block
+    '''
+    if blocks is None:
+        blocks = range(-(-total_rolls // _BLOCK_ROLLS))
+    for block in blocks:
+        start = block * _BLOCK_ROLLS
+        yield start, min(start + _BLOCK_ROLLS, total_rolls), np.random.default_rng(_child_seed(seed_seq, block))
+
+
+def _entropy_json(entropy):
+    '''
+    PURPOSE: Returns entropy of a SeedSequence (int, or sequence of ints ex. seed=[1, 2]) as JSON text,
+             so Game.save keeps ints of any size and Game.load rebuilds same entropy.
+    '''
+    if not isinstance(entropy, int):
+        entropy = np.asarray(entropy).tolist()
+    return json.dumps(entropy)
+
+
+def _split_blocks(total_rolls, workers):
+    '''
+    PURPOSE: Splits blocks of play event into contiguous ranges of blocks, a few per worker so work stays balanced.
+    '''
+    num_blocks = -(-total_rolls // _BLOCK_ROLLS)
+    step = max(1, -(-num_blocks // (workers * 4)))
+    return [range(first, min(first + step, num_blocks)) for first in range(0, num_blocks, step)]
+
+
+def _run_tasks(function, tasks, workers):
+    '''
+    PURPOSE: Runs function on each tuple of arguments in tasks, over a pool of worker processes when workers > 1.
+             Returns list of results in same order as tasks.
+    '''
+    if workers == 1 or len(tasks) <= 1:
+        return [function(*task) for task in tasks]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, *zip(*tasks)))
 
 class Game:
     '''
@@ -98,7 +456,8 @@ class Game:
     returns Game class object. Each Die object may have different weights.
     Die class object contains the Die's faces and corresponding weights.
     Also, can random sample from each die's vector of faces according to weights,
-    to simulate rolling od dice. Stores most recent results of play.
+    to simulate rolling od dice. Stores most recent results of play
+    as compact integer matrix of face positions.
     
     INPUT
     die_list    list of already instantiated similar Die objects.
@@ -116,38 +475,168 @@ class Game:
         OUTPUT- outputs and attributes
         self.__dice <- private attribute containing list of Die objects.
                        Used in other methods for Game class.
+        self.__faces <- private NumPy array, face label table shared by all dice (sorted when faces are sortable).
+                        Play results store positions in this table instead of face labels.
+        self.__face_maps <- private list, per die array mapping die's face positions to positions in self.__faces.
+        self.__results <- private integer matrix of most recent play, empty until play is called.
+        self.generation <- public attribute, number of play events so far.
+        self.__seed_seq <- private numpy SeedSequence of most recent play, saved with results.
+        self.__shown <- private dict of dataframes/arrays built by show method for most recent play.
         '''
         self.__dice = die_list#assumes argument is list of Die objects
+        all_faces = np.concatenate([die._faces() for die in die_list])
+        try:
+            faces = np.unique(all_faces)
+        except TypeError:
+            #faces of mixed types can't be sorted, keep first seen order
+            faces = np.array(list(dict.fromkeys(all_faces.tolist())), dtype=all_faces.dtype)
+        face_index = {face: i for i, face in enumerate(faces.tolist())}
+        self.__faces = faces
+        self.__face_maps = [np.array([face_index[face] for face in die._faces().tolist()], dtype=np.intp)
+                            for die in die_list]
+        self.__results = np.empty((0, len(die_list)), dtype=np.min_scalar_type(max(len(faces) - 1, 0)))
+        self.generation = 0
+        self.__seed_seq = None
+        self.__shown = {}
     
-    def play(self, total_rolls=1):
+    @_profiled(lambda result, self, *args, **kwargs: (len(self.__results), self.__results))
+    def play(self, total_rolls=1, seed=None, workers=1):
         '''
-        PURPOSE: Stores face outcome of all dice for each roll in private dataframe, 
-                 given number of total desired rolls. Dataframe has shape N rolls by M dice.
+        PURPOSE: Stores face outcome of all dice for each roll in private integer matrix, 
+                 given number of total desired rolls. Matrix has shape N rolls by M dice,
+                 and holds positions in shared face table using smallest unsigned dtype that fits.
+                 Rolls can be spread over a pool of worker processes, each block of rolls
+                 seeded from its own child of one master seed.
                  
 
         INPUT- arguments for method
         total_rolls <- defaults to 1, total rolls desired for play event with Dice in Game class object.
+        seed <- optional int seed or numpy Generator, same seed reproduces same play results,
+                whatever the number of workers. defaults to None.
+        workers <- number of worker processes, defaults to 1 (no pool). None uses every core.
            
         OUTPUT- outputs and attributes
-        self.__results <- private dataframe with play event results,
-                          contains columns for roll number and die number, with corresponding face rolled as values. 
+        self.__results <- private read-only integer matrix with play event results,
+                          row for each roll and column for each die, with position of face rolled as values. 
                           shape N rolls by M dice.
+        self.generation <- public attribute, incremented by 1 each play, so Analyzer knows when results changed.
         '''
-        results = pd.DataFrame(index=range(1, total_rolls+1), 
-                          columns=[i for i in range(0, len(self.__dice))])
-        results.index.name = 'roll_number'
-        for i, die in enumerate(self.__dice):
-            results[i] = die.roll_die(total_rolls)
+        workers = workers or os.cpu_count()
+        seed_seq = _seed_sequence(seed)
+        if workers == 1:
+            results = self._play_blocks(total_rolls, seed_seq)
+        else:
+            parts = _run_tasks(_play_worker, self._tasks(total_rolls, seed_seq, workers), workers)
+            results = np.concatenate(parts) if parts else self._play_blocks(0, seed_seq)
+        self.__set_results(results, seed_seq)
+
+    def __set_results(self, results, seed_seq):
+        '''
+        PURPOSE: Makes results the most recent play: stores them read-only, drops dataframes built
+                 by show method for previous play and increments self.generation.
+        '''
+        #results are shared read-only with Analyzer, never modified after play
+        results.setflags(write=False)
         self.__results = results
+        self.__seed_seq = seed_seq
+        self.__shown = {}
+        self.generation += 1
+
+    def play_chunks(self, total_rolls=1, chunk_size=2**16, seed=None):
+        '''
+        PURPOSE: Streams play event in chunks of rolls instead of storing all results,
+                 so simulations larger than memory can be analyzed chunk by chunk (see RunningAnalyzer).
+                 Same seed gives same rolls as play method, whatever the chunk_size.
+                 Does not internally store results.
+
+        INPUT- arguments for method
+        total_rolls <- defaults to 1, total rolls desired for play event with Dice in Game class object.
+        chunk_size <- number of rolls per chunk, defaults to 65536. Last chunk may be smaller.
+        seed <- optional int seed or numpy Generator, same seed reproduces same play results.
+                defaults to None.
+
+        OUTPUT- outputs and attributes
+        chunk_size Argument Error message <- if chunk_size passed is not above 0,
+                                             returns "Chunk size must be above 0!" and yields nothing
+        generator <- yields integer matrix of face positions for each chunk,
+                     shape chunk_size rolls by M dice.
+        '''
+        try:
+            assert chunk_size > 0, "Chunk size must be above 0!"
+        except AssertionError as e:
+            print(e)
+            return
+        pending, pending_rolls = [], 0
+        for block in self._iter_blocks(total_rolls, _seed_sequence(seed)):
+            while len(block):
+                piece, block = block[:chunk_size - pending_rolls], block[chunk_size - pending_rolls:]
+                pending.append(piece)
+                pending_rolls += len(piece)
+                if pending_rolls == chunk_size:
+                    yield pending[0] if len(pending) == 1 else np.concatenate(pending)
+                    pending, pending_rolls = [], 0
+        if pending:
+            yield np.concatenate(pending)
+
+    def _tasks(self, total_rolls, seed_seq, workers):
+        '''
+        PURPOSE: Splits play event into worker tasks, tuples of (dice, total_rolls, seed_seq, range of blocks).
+        '''
+        return [(self.__dice, total_rolls, seed_seq, blocks) for blocks in _split_blocks(total_rolls, workers)]
+
+    def _play_blocks(self, total_rolls, seed_seq, blocks=None):
+        '''
+        PURPOSE: Returns integer matrix of face positions for given range of blocks of play event, defaults to all blocks.
+        '''
+        if blocks is None:
+            blocks = range(-(-total_rolls // _BLOCK_ROLLS))
+        first_roll = min(blocks.start * _BLOCK_ROLLS, total_rolls)
+        last_roll = min(blocks.stop * _BLOCK_ROLLS, total_rolls)
+        results = np.empty((last_roll - first_roll, len(self.__dice)), dtype=self.__results.dtype)
+        for start, stop, rng in _block_rngs(total_rolls, seed_seq, blocks):
+            self._roll_block(stop - start, rng, out=results[start - first_roll:stop - first_roll])
+        return results
+
+    def _iter_blocks(self, total_rolls, seed_seq, blocks=None):
+        '''
+        PURPOSE: Yields integer matrix of face positions for each block in given range of blocks, defaults to all blocks.
+        '''
+        for start, stop, rng in _block_rngs(total_rolls, seed_seq, blocks):
+            yield self._roll_block(stop - start, rng)
+
+    def _roll_block(self, num_rolls, rng, out=None):
+        '''
+        PURPOSE: Rolls every die num_rolls times from rng and stores face positions in shared face table.
+
+        INPUT- arguments for method
+        num_rolls <- number of rolls in block
+        rng <- numpy Generator for block
+        out <- optional integer matrix to fill, shape num_rolls by M dice
+
+        OUTPUT- outputs and attributes
+        out <- integer matrix of face positions for block
+        '''
+        if out is None:
+            out = np.empty((num_rolls, len(self.__dice)), dtype=self.__results.dtype)
+        for i, die in enumerate(self.__dice):
+            out[:, i] = self.__face_maps[i][die._roll_codes(num_rolls, rng)]
+        return out
     
-    def show(self, form = 'wide'):
+    @_profiled(lambda result, self, *args, **kwargs: (len(self.__results), result))
+    def show(self, form = 'wide', as_arrays=False):
         '''
         PURPOSE: Displays dataframe containing results of most recent play.
                  Format of play results dataframe depends on parameter value of 'wide' or 'narrow'.
+                 Dataframe is built from private integer matrix, faces as categorical columns,
+                 the first time it is asked for after a play, and reused until next play.
+                 'narrow' form index and face column are built directly from the matrix, without reshaping a dataframe.
 
         INPUT- arguments for method
         form <- can be 'narrow' or 'wide to designate desired format of most recent play results.
                 defaults as 'wide'.
+        as_arrays <- defaults to False. True returns plain NumPy arrays instead of dataframe:
+                     'wide' form -> face rolled matrix, shape N rolls by M dice
+                     'narrow' form -> (roll_number, die_number, face_rolled) arrays, same row order as dataframe
                 
         OUTPUT- outputs and attributes
         'narrow' form play results dataframe <- two column index with roll number and die number, and a column for face rolled
@@ -156,15 +645,379 @@ class Game:
         '''
         try:
             assert form == 'wide' or form == 'narrow', "Invalid option, pass 'wide' or 'narrow' as argument!"
-            if form == 'wide':
-                return self.__results
+            if (form, as_arrays) not in self.__shown:
+                if as_arrays:
+                    self.__shown[form, as_arrays] = self.__wide_arrays() if form == 'wide' else self.__narrow_arrays()
+                else:
+                    self.__shown[form, as_arrays] = self._frame(self.__results) if form == 'wide' else self.__narrow_frame()
+            return self.__shown[form, as_arrays]
+        except AssertionError as e:
+            print(e)
+
+    def __wide_arrays(self):
+        '''
+        PURPOSE: Returns face rolled matrix of most recent play, shape N rolls by M dice.
+        '''
+        return self.__faces[self.__results]
+
+    def __narrow_arrays(self):
+        '''
+        PURPOSE: Returns roll number, die number and face rolled arrays of most recent play,
+                 ordered by die number then roll number.
+        '''
+        num_rolls, num_dice = self.__results.shape
+        return (np.tile(np.arange(1, num_rolls + 1), num_dice), np.repeat(np.arange(num_dice), num_rolls),
+                self.__faces[self.__results.T.ravel()])
+
+    def __narrow_frame(self):
+        '''
+        PURPOSE: Builds 'narrow' form dataframe of most recent play, ordered by die number then roll number.
+                 MultiIndex is built from level values and integer codes, face column from matrix
+                 transposed in a single copy, instead of reset_index/melt/set_index round trips.
+        '''
+        import pandas as pd
+        num_rolls, num_dice = self.__results.shape
+        index = pd.MultiIndex(levels=[np.arange(1, num_rolls + 1), np.arange(num_dice)],
+                              codes=[np.tile(np.arange(num_rolls), num_dice), np.repeat(np.arange(num_dice), num_rolls)],
+                              names=['roll_number', 'die_number'], verify_integrity=False)
+        face_rolled = pd.Categorical.from_codes(self.__results.T.ravel(), categories=self.__faces)
+        return pd.DataFrame({'face_rolled': face_rolled}, index=index)
+
+    @_profiled(lambda result, self, *args, **kwargs: (result['rolls'] if result else 0, None))
+    def estimate(self, statistic='jackpot', target_width=None, rel_error=None, confidence=0.95,
+                 face=None, combo=None, batch_size=2**16, max_rolls=10**9, seed=None):
+        '''
+        PURPOSE: Plays game in batches until confidence interval on a rate is precise enough, instead of
+                 guessing number of rolls. After each batch a Wilson score interval is computed, and play stops
+                 once it is narrower than target_width, or its half width is below rel_error of the estimate.
+                 Same seed gives same rolls as play method. Does not internally store results.
+
+        INPUT- arguments for method
+        statistic <- rate to estimate, defaults to 'jackpot':
+                     'jackpot' -> fraction of rolls with all faces identical
+                     'combo' -> fraction of rolls with combination combo, faces in any order
+                     'face' -> fraction of dice showing face, over all rolls
+        target_width <- stop when interval width (high - low) is at most this
+        rel_error <- stop when interval half width is at most this fraction of estimate
+        confidence <- confidence level of interval, defaults to 0.95
+        face <- face to estimate rate of, for 'face' statistic
+        combo <- one face per die, for 'combo' statistic
+        batch_size <- rolls per batch, defaults to 65536
+        max_rolls <- stop after this many rolls even if not precise enough, defaults to 10**9
+        seed <- optional int seed or numpy Generator, defaults to None.
+
+        OUTPUT- outputs and attributes
+        Argument Error message <- if statistic, face, combo, confidence, batch_size or max_rolls passed is invalid,
+                                  or neither stopping rule given
+        estimate_dict <- dict with keys:
+                         'estimate' -> estimated rate
+                         'interval' -> (low, high) confidence interval
+                         'rolls' -> number of rolls played
+                         'hits' -> number of successes counted (rolls, or dice for 'face')
+                         'converged' -> False if max_rolls reached before interval was precise enough
+        '''
+        face_index = {f: i for i, f in enumerate(self.__faces.tolist())}
+        try:
+            assert statistic in ('jackpot', 'combo', 'face'), "Invalid option, pass 'jackpot', 'combo' or 'face' as statistic!"
+            assert target_width is not None or rel_error is not None, "Pass target_width or rel_error to know when to stop!"
+            assert 0 < confidence < 1, "Confidence must be between 0 and 1!"
+            assert max_rolls > 0, "Max rolls must be above 0!"
+            assert batch_size > 0, "Batch size must be above 0!"
+            if statistic == 'face':
+                assert face in face_index, "Face entered not in Game's dice!"
+            if statistic == 'combo':
+                assert combo is not None and len(combo) == len(self.__dice) and all(f in face_index for f in combo), \
+                       "Combo must have one face of the dice per die!"
+        except AssertionError as e:
+            print(e)
+            return None
+        if statistic == 'combo':
+            target = np.sort([face_index[f] for f in combo])
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        hits, trials, rolls = 0, 0, 0
+        for chunk in self.play_chunks(max_rolls, batch_size, seed):
+            rolls += len(chunk)
+            if statistic == 'jackpot':
+                hits += int((chunk == chunk[:, :1]).all(axis=1).sum())
+                trials += len(chunk)
+            elif statistic == 'combo':
+                hits += int((np.sort(chunk, axis=1) == target).all(axis=1).sum())
+                trials += len(chunk)
+            else:
+                hits += int((chunk == face_index[face]).sum())
+                trials += chunk.size
+            low, high = _wilson_interval(hits, trials, z)
+            rate = hits / trials
+            converged = ((target_width is not None and high - low <= target_width) or
+                         (rel_error is not None and hits > 0 and (high - low) / 2 <= rel_error * rate))
+            if converged:
+                break
+        return {'estimate': rate, 'interval': (low, high), 'rolls': rolls, 'hits': hits, 'converged': converged}
+
+    @_profiled(lambda result, self, *args, **kwargs: (result['rolls'] if result else 0, None))
+    def rare_estimate(self, statistic='jackpot', combo=None, total_rolls=10**5, tilt=0.5, confidence=0.95, seed=None):
+        '''
+        PURPOSE: Estimates probability of a rare jackpot or combination by importance sampling, for games
+                 where plain play almost never sees one. Rolls are drawn from tilted dice that favor the event,
+                 and each roll where the event happens is reweighted by likelihood ratio
+                 (probability under real weights / probability under tilted weights), so estimate is unbiased.
+                 'jackpot' -> each roll picks a target face, then each die shows it with probability tilt,
+                              otherwise rolls with its own weights (mixture over target faces).
+                 'combo' -> each die shows a face drawn from combo with probability tilt,
+                            otherwise rolls with its own weights.
+                 Does not internally store results.
+
+        INPUT- arguments for method
+        statistic <- 'jackpot' or 'combo', defaults to 'jackpot'
+        combo <- one face per die, for 'combo' statistic, faces in any order
+        total_rolls <- number of tilted rolls, defaults to 100000
+        tilt <- probability a die is forced toward the event, between 0 and 1, defaults to 0.5
+        confidence <- confidence level of interval, defaults to 0.95
+        seed <- optional int seed or numpy Generator, defaults to None.
+
+        OUTPUT- outputs and attributes
+        Argument Error message <- if statistic, combo, tilt, total_rolls or confidence passed is invalid
+        estimate_dict <- dict with keys:
+                         'estimate' -> estimated probability of event per roll
+                         'std_error' -> standard error of estimate
+                         'interval' -> (low, high) normal confidence interval
+                         'rolls' -> number of tilted rolls
+                         'hits' -> number of tilted rolls where event happened
+        '''
+        face_index = {f: i for i, f in enumerate(self.__faces.tolist())}
+        try:
+            assert statistic in ('jackpot', 'combo'), "Invalid option, pass 'jackpot' or 'combo' as statistic!"
+            assert 0 < tilt <= 1, "Tilt must be above 0 and at most 1!"
+            assert total_rolls > 0, "Total rolls must be above 0!"
+            assert 0 < confidence < 1, "Confidence must be between 0 and 1!"
+            if statistic == 'combo':
+                assert combo is not None and len(combo) == len(self.__dice) and all(f in face_index for f in combo), \
+                       "Combo must have one face of the dice per die!"
+        except AssertionError as e:
+            print(e)
+            return None
+        face_probs = self._face_probs()
+        num_dice = len(self.__dice)
+        if statistic == 'jackpot':
+            #target faces in proportion to geometric mean of dice probabilities, never a face that can't jackpot
+            targets = face_probs.prod(axis=0) ** (1 / num_dice)
+            jackpot_probs = face_probs.prod(axis=0)
+            if not targets.sum():
+                return {'estimate': 0.0, 'std_error': 0.0, 'interval': (0.0, 0.0), 'rolls': 0, 'hits': 0}
+            targets = targets / targets.sum()
+            #tilted probability of jackpot on face f: target f and every die tilted or rolled f,
+            #or another target and every die rolled f with its own weights
+            tilted_probs = (targets * ((1 - tilt) * face_probs + tilt).prod(axis=0) +
+                            (1 - targets) * ((1 - tilt) * face_probs).prod(axis=0))
+            ratios = np.divide(jackpot_probs, tilted_probs, out=np.zeros_like(jackpot_probs), where=tilted_probs > 0)
+        else:
+            target = np.sort([face_index[f] for f in combo])
+            targets = np.bincount(target, minlength=len(self.__faces)) / num_dice
+            tilted_face_probs = (1 - tilt) * face_probs + tilt * targets
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        total, total_squares, hits = 0.0, 0.0, 0
+        for start, stop, rng in _block_rngs(total_rolls, _seed_sequence(seed)):
+            rows = self._roll_block(stop - start, rng).astype(np.intp)
+            forced = rng.random(rows.shape) < tilt
+            if statistic == 'jackpot':
+                rows = np.where(forced, rng.choice(len(targets), size=(len(rows), 1), p=targets), rows)
+                hit = (rows == rows[:, :1]).all(axis=1)
+                weights = ratios[rows[hit, 0]]
             else:
-                narrow = self.__results.reset_index()
-                narrow1 = narrow.melt(id_vars='roll_number', var_name='die_number', value_name='face_rolled').set_index('roll_number')
-                narrow2 = narrow1.set_index('die_number', append=True)
-                return narrow2
+                rows = np.where(forced, rng.choice(len(targets), size=rows.shape, p=targets), rows)
+                hit = (np.sort(rows, axis=1) == target).all(axis=1)
+                dice = np.arange(num_dice)
+                weights = (face_probs[dice, rows[hit]] / tilted_face_probs[dice, rows[hit]]).prod(axis=1)
+            hits += int(hit.sum())
+            total += float(weights.sum())
+            total_squares += float((weights ** 2).sum())
+        estimate = float(total / total_rolls)
+        std_error = math.sqrt(max(total_squares / total_rolls - estimate ** 2, 0.0) / total_rolls)
+        return {'estimate': estimate, 'std_error': std_error,
+                'interval': (max(0.0, estimate - z * std_error), estimate + z * std_error),
+                'rolls': total_rolls, 'hits': hits}
+
+    @_profiled(lambda result, self, *args, **kwargs: (len(self.__results), self.__results))
+    def save(self, path):
+        '''
+        PURPOSE: Saves results of most recent play and dice configuration (faces, weights and seed of play)
+                 in compact binary form, to directory path:
+                 results.npy <- integer matrix of play results, can be reopened memory-mapped by load method
+                 dice.npz <- faces and weights of each distinct die, which die each column is, and seed
+
+        INPUT- arguments for method
+        path <- directory to save to, created if missing
+
+        OUTPUT- outputs and attributes
+        files results.npy and dice.npz in path
+        '''
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'results.npy'), self.__results)
+        #dice shared between columns, ex. [die1]*5, are saved once
+        unique_dice = list({id(die): die for die in self.__dice}.values())
+        positions = {id(die): i for i, die in enumerate(unique_dice)}
+        config = {'die_index': np.array([positions[id(die)] for die in self.__dice]),
+                  'seed_entropy': np.array('' if self.__seed_seq is None else _entropy_json(self.__seed_seq.entropy)),
+                  'seed_spawn_key': np.array(() if self.__seed_seq is None else self.__seed_seq.spawn_key, dtype=np.int64)}
+        for i, die in enumerate(unique_dice):
+            config['faces_%d' % i] = die._faces()
+            config['weights_%d' % i] = die._weights()
+        np.savez(os.path.join(path, 'dice.npz'), **config)
+
+    @classmethod
+    @_profiled(lambda result, cls, *args, **kwargs: (len(result.__results), None))
+    def load(cls, path, mmap=True):
+        '''
+        PURPOSE: Creates Game class object from directory written by save method, with saved dice
+                 and saved play results as its most recent play. Results are memory-mapped read-only by default,
+                 so Analyzer and RunningAnalyzer (see results_chunks) compute over a saved run without loading
+                 it all into RAM, and several processes loading the same file share one copy in memory.
+                 Only load files you trust, faces of object dtype are unpickled.
+
+        INPUT- arguments for method
+        path <- directory written by save method
+        mmap <- defaults to True, memory-map results. False reads results fully into memory.
+
+        OUTPUT- outputs and attributes
+        Game <- Game class object with saved dice, play results and seed
+        '''
+        with np.load(os.path.join(path, 'dice.npz'), allow_pickle=True) as config:
+            unique_dice = []
+            while 'faces_%d' % len(unique_dice) in config:
+                die = Die(config['faces_%d' % len(unique_dice)])
+                die._set_weights(config['weights_%d' % len(unique_dice)])
+                unique_dice.append(die)
+            game = cls([unique_dice[i] for i in config['die_index']])
+            seed_seq = None
+            if str(config['seed_entropy']):
+                seed_seq = np.random.SeedSequence(json.loads(str(config['seed_entropy'])),
+                                                  spawn_key=tuple(config['seed_spawn_key'].tolist()))
+        game.__set_results(np.load(os.path.join(path, 'results.npy'), mmap_mode='r' if mmap else None), seed_seq)
+        return game
+
+    def results_chunks(self, chunk_size=2**16):
+        '''
+        PURPOSE: Yields results of most recent play in chunks of rolls, as views without copying,
+                 ex. RunningAnalyzer(game).consume(game.results_chunks()) over a memory-mapped saved run.
+
+        INPUT- arguments for method
+        chunk_size <- number of rolls per chunk, defaults to 65536. Last chunk may be smaller.
+
+        OUTPUT- outputs and attributes
+        generator <- yields read-only integer matrix of face positions for each chunk
+        '''
+        for start in range(0, len(self.__results), chunk_size):
+            yield self.__results[start:start + chunk_size]
+
+    def jackpot_probability(self):
+        '''
+        PURPOSE: computes exact probability a roll results in all faces being identical, from dice weights
+                 and without playing: sum over faces of product of each die's probability for that face.
+                 Multiply by number of rolls for expected Analyzer.jackpot() result.
+
+        INPUT- self argument only, ex. game_object.jackpot_probability()
+
+        OUTPUT- outputs and attributes
+        probability <- exact jackpot probability as float
+        '''
+        return float(self._face_probs().prod(axis=0).sum())
+
+    def combo_probability(self, combo):
+        '''
+        PURPOSE: computes exact probability a roll results in given combination of faces, in any order,
+                 from dice weights and without playing. Dice are added one at a time, keeping probability
+                 of each multiset of faces still left to roll, so full outcome space is never enumerated.
+
+        INPUT- arguments for method
+        combo <- one face per die, in any order, ex. ('H', 'H', 'T')
+
+        OUTPUT- outputs and attributes
+        combo Argument Error message <- if combo passed doesn't have one face per die, or has face not in dice,
+                                        returns "Combo must have one face of the dice per die!"
+        probability <- exact combination probability as float
+        '''
+        face_index = {face: i for i, face in enumerate(self.__faces.tolist())}
+        try:
+            combo = list(combo)
+            assert len(combo) == len(self.__dice) and all(face in face_index for face in combo), \
+                   "Combo must have one face of the dice per die!"
         except AssertionError as e:
             print(e)
+            return None
+        combo_faces, combo_counts = np.unique([face_index[face] for face in combo], return_counts=True)
+        states = {tuple(combo_counts): 1.0}
+        for die_probs in self._face_probs()[:, combo_faces]:
+            next_states = {}
+            for state, state_prob in states.items():
+                for j, face_prob in enumerate(die_probs):
+                    if state[j] and face_prob:
+                        left = state[:j] + (state[j] - 1,) + state[j + 1:]
+                        next_states[left] = next_states.get(left, 0.0) + state_prob * face_prob
+            states = next_states
+        return states.get((0,) * len(combo_faces), 0.0)
+
+    @_profiled(lambda result, self, *args, **kwargs: (len(result), result))
+    def combo_probabilities(self, total_rolls=None):
+        '''
+        PURPOSE: computes exact probability of every distinct combination of faces, from dice weights
+                 and without playing. Dice are added one at a time, merging sorted partial combinations,
+                 so work grows with number of distinct combinations instead of every ordered outcome.
+
+        INPUT- arguments for method
+        total_rolls <- optional number of rolls, adds column of expected counts for a play event of that size.
+
+        OUTPUT- outputs and attributes
+        dataframe <- same multi-columned index of combinations as Analyzer.combo_df,
+                     with probability column, and expected_counts column when total_rolls passed.
+        '''
+        states = np.zeros((1, 0), dtype=np.intp)
+        state_probs = np.ones(1)
+        for die_probs in self._face_probs():
+            faces = np.flatnonzero(die_probs)
+            rows = np.concatenate([np.repeat(states, len(faces), axis=0),
+                                   np.tile(faces, len(states))[:, None]], axis=1)
+            weights = np.repeat(state_probs, len(faces)) * np.tile(die_probs[faces], len(states))
+            states, state_probs = _unique_rows(np.sort(rows, axis=1), len(self.__faces), weights)
+        import pandas as pd
+        new_index = pd.MultiIndex(levels=[self.__faces] * states.shape[1], codes=list(states.T))
+        combo_probs_df = pd.DataFrame({'probability': state_probs}, index=new_index)
+        if total_rolls is not None:
+            combo_probs_df['expected_counts'] = state_probs * total_rolls
+        return combo_probs_df
+
+    def _face_probs(self):
+        '''
+        PURPOSE: Returns matrix of each die's normalized probability for each face in shared face table, M dice by K faces.
+        '''
+        face_probs = np.zeros((len(self.__dice), len(self.__faces)))
+        for i, die in enumerate(self.__dice):
+            np.add.at(face_probs[i], self.__face_maps[i], die._sampling_table()[0])
+        return face_probs
+
+    def _results(self):
+        '''
+        PURPOSE: Returns private integer matrix of most recent play and shared face table, for use by Analyzer class.
+        '''
+        return self.__results, self.__faces
+
+    def _frame(self, results, roll_numbers=None):
+        '''
+        PURPOSE: Builds 'wide' form dataframe with categorical face columns from rows of integer results matrix.
+
+        INPUT- arguments for method
+        results <- integer matrix of face positions, rows are rolls and columns are dice
+        roll_numbers <- roll number of each row, defaults to 1..N
+
+        OUTPUT- outputs and attributes
+        dataframe <- roll_number named index, each die number as a column
+        '''
+        import pandas as pd
+        if roll_numbers is None:
+            index = pd.RangeIndex(1, len(results) + 1, name='roll_number')
+        else:
+            index = pd.Index(roll_numbers, name='roll_number')
+        return pd.DataFrame({i: pd.Categorical.from_codes(results[:, i], categories=self.__faces)
+                             for i in range(results.shape[1])}, index=index)
 
 
 class Analyzer:
@@ -188,12 +1041,45 @@ class Analyzer:
         OUTPUT- outputs and attributes
         self.__game <- private attribute containing argument of instantiated Game class object.
                        Used in other methods for Analyzer class.
+        self.__cache <- private dict of computed statistics and shared intermediates,
+                        valid for play event self.__cache_generation of the game.
+        self._frames <- dict of dataframe attribute name to its builder, dataframes are built on first access.
         '''
         self.__game= game_obj
+        self.__cache = {}
+        self.__cache_generation = None
+        self._frames = {}
+
+    jackpot_df = _frame_property('jackpot_df')
+    combo_df = _frame_property('combo_df')
+    word_matches_df = _frame_property('word_matches_df')
+    face_counts_df = _frame_property('face_counts_df')
+
+    def __cached(self, name, compute):
+        '''
+        PURPOSE: Returns cached value for name, computing it with compute() first if game
+                 has been played since it was cached. Whole cache is dropped after a new play.
+        '''
+        if self.__cache_generation != self.__game.generation:
+            self.__cache = {}
+            self.__cache_generation = self.__game.generation
+        if name not in self.__cache:
+            self.__cache[name] = compute()
+        return self.__cache[name]
+
+    def __sorted_rows(self):
+        '''
+        PURPOSE: Returns cached play results with faces sorted within each roll.
+                 Face table is sorted, so sorting face positions sorts faces within each roll.
+        '''
+        return self.__cached('sorted_rows', lambda: np.sort(self.__game._results()[0], axis=1))
     
+    @_profiled(lambda result, self: (len(self.__game._results()[0]), None))
     def jackpot(self):
         '''
         PURPOSE: computes how many times the game resulted in all faces being identical. 
+                 Counted with NumPy, dataframe of jackpot rolls is only built when self.jackpot_df is used.
+                 Reuses result computed for same play event.
 
         INPUT- self argument only, ex. game_object.jackpot()
            
@@ -202,49 +1088,104 @@ class Analyzer:
                            roll number as named index.
         
         len(self.jackpot_df) <- how many times a roll in a game resulted in identical faces,
-                                computed by getting number of rolls in self.jackpot_df using len()
+                                same as number of rolls in self.jackpot_df
+        '''
+        results = self.__game._results()[0]
+        jackpot_rows = self.__cached('jackpot_rows', lambda: self.__jackpot_rows(results))
+        self._frames['jackpot_df'] = self.__cached('jackpot_df', lambda: _lazy(self.__game._frame, results[jackpot_rows],
+                                                                               jackpot_rows + 1))
+        return len(jackpot_rows)
+
+    def __jackpot_rows(self, results):
+        '''
+        PURPOSE: Returns positions of jackpot rolls in results, for jackpot method.
         '''
-        wide_results=self.__game.show().copy(deep=True)
-        jackpot_filter = wide_results.apply(lambda row: row.nunique() == 1, axis=1)
-        self.jackpot_df = wide_results[jackpot_filter]
-        return len(self.jackpot_df)
+        #a roll is a jackpot when every die matches the first die
+        return np.flatnonzero((results == results[:, :1]).all(axis=1))
                 
-    def combo(self):
+    @_profiled(lambda result, self, *args, **kwargs: (len(self.__game._results()[0]), None))
+    def combo(self, ordered=False, top_k=None, capacity=None):
         '''
         PURPOSE: Given instantiated game class object, 
                  computes the distinct combinations of faces rolled, along with their counts. 
+                 Each roll is packed into one integer key (mixed radix) for counting.
+                 Counted with NumPy, dataframe is only built when self.combo_df is used.
+                 Reuses result computed for same play event.
 
-        INPUT- self argument only, ex. game_object.combo()
+        INPUT- arguments for method
+        ordered <- defaults to False, faces sorted within each roll so order of dice doesn't matter.
+                   True counts permutations, faces kept in die order.
+        top_k <- optional number of most frequent combinations to keep, most frequent first.
+                 defaults to None, every combination sorted by faces.
+        capacity <- optional bound on number of combinations held while counting, for games with too many
+                    distinct combinations. Counts become approximate (Misra-Gries summary): each count may be
+                    low by at most self.combo_error, and combinations rarer than that may be missing.
+                    defaults to None, exact counts.
            
         OUTPUT- outputs and attributes
         self.combo_df <- public attribute containing dataframe,
                          with distinct combinations of faces rolled in game as a multi-columned index.
                          And a column containing counts of each combination.
+        self.combo_error <- public attribute, largest amount a count in self.combo_df can be low by, 0 when exact.
+        '''
+        combos, counts, self.combo_error = self.__cached(('combo_counts', ordered, capacity),
+                                                         lambda: self.__combo_counts(ordered, capacity))
+        self._frames['combo_df'] = self.__cached(('combo_df', ordered, top_k, capacity),
+                                                 lambda: _lazy(_combo_frame, self.__game._results()[1], combos, counts, top_k))
+
+    def __combo_counts(self, ordered, capacity):
+        '''
+        PURPOSE: Returns distinct combinations, their counts and count error bound, for combo method.
         '''
-        intial_df = self.__game.show().copy(deep=True)
-        df2 = intial_df.apply(lambda x: tuple(sorted(tuple(x))), axis=1)
-        #returns series so converted back to dataframe below
-        df3 = pd.DataFrame({'roll_number':df2.index, 'combinations':df2.values}).set_index('roll_number')
-        #getting counts
-        freq = df3.apply(lambda x: tuple(x), axis=1).value_counts()
-        df3['counts'] = df3.apply(lambda x: freq[tuple(x)], axis=1)
-        #dropping extras now that counts has been made
-        df3 = df3.drop_duplicates()
-        #making tuples index instead of roll_number
-        df3 = df3.set_index('combinations')
-        # Index column combination tuples into MultiIndex
-        new_index = pd.MultiIndex.from_tuples(df3.index)
-        # Set multiindex as new index
-        df3.index = new_index
-        #get number of levels
-        num_levels = df3.index.nlevels
-        # sort multi index based on c=index column 0,1,2
-        df3 = df3.sort_index(level=[x for x in range(0, num_levels)])
-        self.combo_df = df3
+        results, faces = self.__game._results()
+        rows = results if ordered else self.__sorted_rows()
+        if capacity is None:
+            combos, counts = _unique_rows(rows, len(faces))
+            combo_error = 0
+        else:
+            combos, counts = rows[:0], np.empty(0, dtype=np.int64)
+            combo_error = 0
+            for start in range(0, len(rows), _BLOCK_ROLLS):
+                chunk_combos, chunk_counts, chunk_error = _trim_counts(*_unique_rows(rows[start:start + _BLOCK_ROLLS],
+                                                                                     len(faces)), capacity)
+                combos, counts, error = _merge_counts(combos, counts, chunk_combos, chunk_counts, len(faces), capacity)
+                combo_error += chunk_error + error
+        return combos, counts, combo_error
         
+    @_profiled(lambda result, self, vocabulary: (len(self.__game._results()[0]), None))
+    def word_matches(self, vocabulary):
+        '''
+        PURPOSE: computes how many rolls spell a word of vocabulary, faces read in die order,
+                 and hits per word (see WordIndex class). Rolls are packed into integer keys once
+                 per play event and reused for every vocabulary.
+
+        INPUT- arguments for method
+        vocabulary <- iterable of words, each a string (one face per character) or sequence of faces
+
+        OUTPUT- outputs and attributes
+        self.word_matches_df <- public attribute containing dataframe with word as index,
+                                counts and frequency columns, for words rolled at least once, most frequent first.
+        matches <- number of rolls matching a word, as integer
+        '''
+        word_index = WordIndex(self.__game, vocabulary)
+        word_index._update_keys(self.__row_keys())
+        word_index.word_counts()
+        self._frames['word_matches_df'] = word_index._frames['word_counts_df']
+        return word_index.matches()
+
+    def __row_keys(self):
+        '''
+        PURPOSE: Returns cached play results with each roll packed into one key, faces in die order.
+        '''
+        results, faces = self.__game._results()
+        return self.__cached('row_keys', lambda: _row_keys(results, len(faces)))
+
+    @_profiled(lambda result, self: (len(self.__game._results()[0]), None))
     def face_counts_per_roll(self):
         '''
         PURPOSE: computes how many times a given face is rolled in each game event. 
+                 Counted with NumPy, dataframe is only built when self.face_counts_df is used.
+                 Reuses result computed for same play event.
 
         INPUT- self argument only, ex. game_object.face_counts_per_roll()
            
@@ -253,6 +1194,504 @@ class Analyzer:
                                of each face for each roll in a game event.
                                Index of roll number and face values as columns(i.e. it is 'wide' form)
         '''
-        show_results= self.__game.show().copy(deep=True)
-        face_counts_df=show_results.apply(pd.Series.value_counts, axis=1)
-        self.face_counts_df=face_counts_df.fillna(0)
\ No newline at end of file
+        faces = self.__game._results()[1]
+        face_counts = self.__cached('face_counts', self.__face_counts)
+        self._frames['face_counts_df'] = self.__cached('face_counts_df', lambda: _lazy(_face_counts_frame, faces, face_counts))
+
+    def __face_counts(self):
+        '''
+        PURPOSE: Returns matrix of face counts for each roll, N rolls by K faces, for face_counts_per_roll method.
+        '''
+        results, faces = self.__game._results()
+        num_rolls, num_faces = len(results), len(faces)
+        #offset each roll's face positions into its own block, then count all rolls at once
+        offsets = results + np.arange(num_rolls)[:, None] * num_faces
+        return np.bincount(offsets.ravel(), minlength=num_rolls * num_faces).reshape(num_rolls, num_faces)
+
+class RunningAnalyzer:
+    '''
+    PURPOSE: Given a single Game class object, keeps running jackpot count, combination counts
+    and per face totals over chunks of rolls (see Game.play_chunks), so statistics
+    of play events larger than memory are computed in bounded memory.
+    Final numbers match Analyzer class on the same rolls. With capacity, each chunk is summarized
+    on its own before merging, so approximate counts match Analyzer when chunks are blocks of 65536 rolls
+    (play method, or Game.play_chunks with default chunk_size).
+    
+    INPUT
+    game_obj      Game class object    
+    
+    OUTPUT
+    RunningAnalyzer      RunningAnalyzer class object
+    '''
+    def __init__(self, game_obj, ordered=False, capacity=None):
+        '''
+        PURPOSE: Creates instance of RunningAnalyzer class object with empty running state,
+                 given instantiated Game class object.
+
+        INPUT- arguments for method
+        game_obj <- instantiated Game class object
+        ordered <- defaults to False, combinations count faces in any order. True counts permutations.
+        capacity <- optional bound on number of combinations kept, see Analyzer.combo. defaults to None, exact counts.
+           
+        OUTPUT- outputs and attributes
+        self.__game <- private attribute containing argument of instantiated Game class object.
+        self.rolls <- public attribute, number of rolls consumed so far
+        self.__jackpots <- private running count of jackpot rolls
+        self.__combos, self.__combo_counts <- private distinct face position rows and their counts
+        self.combo_error <- public attribute, largest amount a combination count can be low by, 0 when exact
+        self.__face_totals <- private running count of each face over all dice and rolls
+        self._frames <- dict of dataframe attribute name to its builder, dataframes are built on first access.
+        '''
+        results, faces = game_obj._results()
+        self.__game = game_obj
+        self.__faces = faces
+        self.__ordered = ordered
+        self.__capacity = capacity
+        self.rolls = 0
+        self.__jackpots = 0
+        self.__combos = np.empty((0, results.shape[1]), dtype=results.dtype)
+        self.__combo_counts = np.empty(0, dtype=np.int64)
+        self.combo_error = 0
+        self.__face_totals = np.zeros(len(faces), dtype=np.int64)
+        self._frames = {}
+
+    combo_df = _frame_property('combo_df')
+    face_totals_df = _frame_property('face_totals_df')
+
+    @_profiled(lambda result, self, chunk: (len(chunk), None))
+    def update(self, chunk):
+        '''
+        PURPOSE: Adds chunk of rolls to running statistics.
+
+        INPUT- arguments for method
+        chunk <- integer matrix of face positions, as yielded by Game.play_chunks
+
+        OUTPUT- outputs and attributes
+        self <- RunningAnalyzer with updated running state
+        '''
+        self.rolls += len(chunk)
+        self.__jackpots += int((chunk == chunk[:, :1]).all(axis=1).sum())
+        combos, counts = _unique_rows(chunk if self.__ordered else np.sort(chunk, axis=1), len(self.__faces))
+        #with capacity, chunk is summarized on its own before merging, same as each block in Analyzer.combo
+        combos, counts, error = _trim_counts(combos, counts, self.__capacity)
+        self.combo_error += error
+        self.__merge_combos(combos, counts)
+        self.__face_totals += np.bincount(chunk.ravel(), minlength=len(self.__faces))
+        return self
+
+    def consume(self, chunks):
+        '''
+        PURPOSE: Adds every chunk of an iterable of chunks to running statistics,
+                 ex. running_analyzer.consume(game_obj.play_chunks(10**9, seed=1))
+
+        INPUT- arguments for method
+        chunks <- iterable of integer matrices of face positions
+
+        OUTPUT- outputs and attributes
+        self <- RunningAnalyzer with updated running state
+        '''
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    @_profiled(lambda result, self, total_rolls=1, *args, **kwargs: (total_rolls, None))
+    def play(self, total_rolls=1, seed=None, workers=1):
+        '''
+        PURPOSE: Plays game without storing results and adds rolls to running statistics.
+                 Rolls are spread over a pool of worker processes, each worker keeps its own
+                 running statistics and they are merged here. Same seed gives same statistics
+                 as Game.play with that seed, whatever the number of workers.
+                 With capacity, each block of rolls is summarized on its own and summaries are merged
+                 in block order, so approximate counts don't depend on how blocks were split between workers.
+
+        INPUT- arguments for method
+        total_rolls <- defaults to 1, total rolls desired for play event.
+        seed <- optional int seed or numpy Generator, defaults to None.
+        workers <- number of worker processes, defaults to 1 (no pool). None uses every core.
+
+        OUTPUT- outputs and attributes
+        self <- RunningAnalyzer with updated running state
+        '''
+        workers = workers or os.cpu_count()
+        tasks = [task + (self.__ordered, self.__capacity)
+                 for task in self.__game._tasks(total_rolls, _seed_sequence(seed), workers)]
+        for partials in _run_tasks(_running_worker, tasks, workers):
+            for partial in partials:
+                self.merge(partial)
+        return self
+
+    def merge(self, other):
+        '''
+        PURPOSE: Adds running state of another RunningAnalyzer for the same dice, ex. one built from other chunks.
+
+        INPUT- arguments for method
+        other <- RunningAnalyzer class object
+
+        OUTPUT- outputs and attributes
+        self <- RunningAnalyzer with combined running state
+        '''
+        self.rolls += other.rolls
+        self.__jackpots += other.__jackpots
+        self.combo_error += other.combo_error
+        self.__merge_combos(other.__combos, other.__combo_counts)
+        self.__face_totals += other.__face_totals
+        return self
+
+    def __merge_combos(self, combos, counts):
+        '''
+        PURPOSE: Adds counted distinct face position rows into running combination counts.
+        '''
+        self.__combos, self.__combo_counts, error = _merge_counts(self.__combos, self.__combo_counts, combos, counts,
+                                                                  len(self.__faces), self.__capacity)
+        self.combo_error += error
+
+    def jackpot(self):
+        '''
+        PURPOSE: returns how many rolls consumed so far resulted in all faces being identical.
+
+        INPUT- self argument only, ex. running_analyzer.jackpot()
+
+        OUTPUT- outputs and attributes
+        self.__jackpots <- number of jackpot rolls as integer
+        '''
+        return self.__jackpots
+
+    def combo(self, top_k=None):
+        '''
+        PURPOSE: computes the distinct combinations of faces rolled so far, along with their counts.
+                 Dataframe is only built when self.combo_df is used.
+
+        INPUT- arguments for method
+        top_k <- optional number of most frequent combinations to keep, most frequent first.
+                 defaults to None, every combination sorted by faces.
+
+        OUTPUT- outputs and attributes
+        self.combo_df <- public attribute containing dataframe, same form as Analyzer.combo_df,
+                         with distinct combinations of faces rolled as a multi-columned index.
+                         And a column containing counts of each combination.
+        '''
+        self._frames['combo_df'] = _lazy(_combo_frame, self.__faces, self.__combos, self.__combo_counts, top_k)
+
+    def face_totals(self):
+        '''
+        PURPOSE: computes how many times each face was rolled so far, over all dice.
+                 Dataframe is only built when self.face_totals_df is used.
+
+        INPUT- self argument only, ex. running_analyzer.face_totals()
+
+        OUTPUT- outputs and attributes
+        self.face_totals_df <- public attribute containing dataframe with face values as index,
+                               and a column containing counts of each face.
+        '''
+        self._frames['face_totals_df'] = _lazy(_face_totals_frame, self.__faces, self.__face_totals.copy())
+
+
+class WordIndex:
+    '''
+    PURPOSE: Given a Game class object and a vocabulary of words, builds an index for counting
+    rolls whose faces, in die order, spell a word of the vocabulary (ordered match, one face per die).
+    Words are encoded once into sorted integer row keys, and each chunk of rolls is matched
+    with one vectorized search, instead of joining faces into strings roll by roll.
+    Rolls can be streamed in chunks (see Game.play_chunks), hits per word are kept running.
+    
+    INPUT
+    game_obj      Game class object
+    vocabulary    iterable of words, each a string (one face per character) or sequence of faces
+    
+    OUTPUT
+    WordIndex      WordIndex class object
+    '''
+    def __init__(self, game_obj, vocabulary):
+        '''
+        PURPOSE: Creates instance of WordIndex class object, encoding each word of vocabulary
+                 with one face per die and only faces of the game. Other words can never be rolled and are skipped.
+
+        INPUT- arguments for method
+        game_obj <- instantiated Game class object
+        vocabulary <- iterable of words, ex. ['CAT', 'DOG'], matched exactly as given (case sensitive)
+
+        OUTPUT- outputs and attributes
+        self.words <- public attribute, list of distinct words that can be rolled, in index order
+        self.rolls <- public attribute, number of rolls matched so far
+        self.__keys <- private sorted array of row keys of self.words
+        self.__hits <- private running count of rolls matching each word
+        self._frames <- dict of dataframe attribute name to its builder, dataframes are built on first access.
+        '''
+        results, faces = game_obj._results()
+        face_index = {face: i for i, face in enumerate(faces.tolist())}
+        num_dice = results.shape[1]
+        words = {}
+        for word in vocabulary:
+            if len(word) == num_dice and all(face in face_index for face in word):
+                words.setdefault(tuple(face_index[face] for face in word), word)
+        rows = np.array(list(words), dtype=results.dtype).reshape(len(words), num_dice)
+        keys = _row_keys(rows, len(faces))
+        order = np.argsort(keys, kind='stable')
+        all_words = list(words.values())
+        self.words = [all_words[i] for i in order]
+        self.rolls = 0
+        self.__num_faces = len(faces)
+        self.__keys = keys[order]
+        self.__hits = np.zeros(len(self.words), dtype=np.int64)
+        self._frames = {}
+
+    word_counts_df = _frame_property('word_counts_df')
+
+    @_profiled(lambda result, self, chunk: (len(chunk), None))
+    def update(self, chunk):
+        '''
+        PURPOSE: Counts rolls of chunk matching a word and adds them to running hits per word.
+
+        INPUT- arguments for method
+        chunk <- integer matrix of face positions, as yielded by Game.play_chunks
+
+        OUTPUT- outputs and attributes
+        self <- WordIndex with updated hits
+        '''
+        return self._update_keys(_row_keys(chunk, self.__num_faces))
+
+    def _update_keys(self, keys):
+        '''
+        PURPOSE: Adds matches of rolls already packed into row keys, ex. keys cached by Analyzer class.
+        '''
+        self.rolls += len(keys)
+        if len(self.__keys):
+            positions = np.minimum(np.searchsorted(self.__keys, keys), len(self.__keys) - 1)
+            matched = positions[self.__keys[positions] == keys]
+            self.__hits += np.bincount(matched, minlength=len(self.__keys))
+        return self
+
+    def consume(self, chunks):
+        '''
+        PURPOSE: Counts matches in every chunk of an iterable of chunks,
+                 ex. word_index.consume(game_obj.play_chunks(10**8, chunk_size=10**6, seed=1))
+
+        INPUT- arguments for method
+        chunks <- iterable of integer matrices of face positions
+
+        OUTPUT- outputs and attributes
+        self <- WordIndex with updated hits
+        '''
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def matches(self):
+        '''
+        PURPOSE: returns how many rolls so far spelled a word of the vocabulary.
+        '''
+        return int(self.__hits.sum())
+
+    def word_counts(self):
+        '''
+        PURPOSE: computes hit count and frequency of each word rolled at least once so far.
+                 Dataframe is only built when self.word_counts_df is used.
+
+        INPUT- self argument only, ex. word_index.word_counts()
+
+        OUTPUT- outputs and attributes
+        self.word_counts_df <- public attribute containing dataframe with word as index,
+                               counts column and frequency column (counts / rolls), most frequent first.
+        '''
+        hit = np.flatnonzero(self.__hits)
+        self._frames['word_counts_df'] = _lazy(_word_counts_frame, [self.words[i] for i in hit], self.__hits[hit],
+                                               max(self.rolls, 1))
+
+
+@_profiled(lambda result, game_list, total_rolls=1, *args, **kwargs: (len(game_list) * total_rolls, None))
+def play_batch(game_list, total_rolls=1, seed=None, workers=1):
+    '''
+    PURPOSE: Plays a batch of games over one pool of worker processes without storing results,
+             and returns running statistics for each game. Each game is seeded with its own child
+             of master seed, so same seed gives same statistics whatever the number of workers.
+
+    INPUT- arguments for function
+    game_list <- list of instantiated Game class objects
+    total_rolls <- defaults to 1, total rolls desired for play event of each game.
+    seed <- optional int seed or numpy Generator, master seed for batch. defaults to None.
+    workers <- number of worker processes, defaults to 1 (no pool). None uses every core.
+
+    OUTPUT- outputs and attributes
+    analyzers <- list of RunningAnalyzer class objects, one per game in same order as game_list
+    '''
+    workers = workers or os.cpu_count()
+    seed_seq = _seed_sequence(seed)
+    tasks, owners = [], []
+    for i, game in enumerate(game_list):
+        game_tasks = game._tasks(total_rolls, _child_seed(seed_seq, i), workers)
+        tasks += game_tasks
+        owners += [i] * len(game_tasks)
+    analyzers = [RunningAnalyzer(game) for game in game_list]
+    for i, partials in zip(owners, _run_tasks(_running_worker, tasks, workers)):
+        for partial in partials:
+            analyzers[i].merge(partial)
+    return analyzers
+
+
+def _play_worker(dice, total_rolls, seed_seq, blocks):
+    '''
+    PURPOSE: Worker process task, returns integer matrix of face positions for range of blocks of play event.
+    '''
+    return Game(dice)._play_blocks(total_rolls, seed_seq, blocks)
+
+
+def _running_worker(dice, total_rolls, seed_seq, blocks, ordered=False, capacity=None):
+    '''
+    PURPOSE: Worker process task, returns list of RunningAnalyzers over range of blocks of play event, to merge in order.
+             Exact counts give one RunningAnalyzer for whole range. With capacity, one per block, so merge order
+             of approximate counts is same whatever the range of blocks of each task.
+    '''
+    game = Game(dice)
+    if capacity is None:
+        return [RunningAnalyzer(game, ordered).consume(game._iter_blocks(total_rolls, seed_seq, blocks))]
+    return [RunningAnalyzer(game, ordered, capacity).update(block)
+            for block in game._iter_blocks(total_rolls, seed_seq, blocks)]
+
+
+def _wilson_interval(hits, trials, z):
+    '''
+    PURPOSE: Wilson score interval for a rate of hits out of trials, z standard normal quantile of confidence.
+             Stays inside [0, 1] and is usable when hits is 0, unlike the normal approximation.
+    '''
+    rate = hits / trials
+    denominator = 1 + z ** 2 / trials
+    center = (rate + z ** 2 / (2 * trials)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / trials + z ** 2 / (4 * trials ** 2)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def _merge_counts(rows, counts, other_rows, other_counts, num_faces, capacity=None):
+    '''
+    PURPOSE: Merges two sets of counted distinct rows. With capacity, keeps at most capacity rows
+             as a Misra-Gries summary: when there are more, the (capacity+1)-th largest count is
+             subtracted from every count and rows left without a positive count are dropped.
+
+    INPUT- arguments for function
+    rows, counts <- distinct rows of face positions and their counts
+    other_rows, other_counts <- distinct rows of face positions and their counts to add
+    num_faces <- number of faces in face table
+    capacity <- optional maximum number of rows kept, defaults to None (exact merge)
+
+    OUTPUT- outputs and attributes
+    (rows, counts, error) <- merged rows and counts, and amount subtracted from every count (0 when exact)
+    '''
+    rows, counts = _unique_rows(np.concatenate([rows, other_rows]), num_faces, np.concatenate([counts, other_counts]))
+    return _trim_counts(rows, counts, capacity)
+
+
+def _trim_counts(rows, counts, capacity=None):
+    '''
+    PURPOSE: Keeps at most capacity counted distinct rows as a Misra-Gries summary, see _merge_counts.
+             Used to summarize each block of rolls on its own before it is merged, so Analyzer and RunningAnalyzer
+             (whatever the number of workers) merge approximate counts the same way.
+
+    OUTPUT- outputs and attributes
+    (rows, counts, error) <- kept rows and counts, and amount subtracted from every count (0 when exact)
+    '''
+    if capacity is None or len(counts) <= capacity:
+        return rows, counts, 0
+    error = int(np.partition(counts, len(counts) - capacity - 1)[len(counts) - capacity - 1])
+    keep = counts > error
+    return rows[keep], counts[keep] - error, error
+
+
+def _combo_frame(faces, combos, counts, top_k=None):
+    '''
+    PURPOSE: Builds combination counts dataframe, combinations of faces as multi-columned index and counts column.
+             With top_k, keeps top_k most frequent combinations, most frequent first (ties in face order).
+    '''
+    if top_k is not None:
+        most_frequent = np.argsort(-counts, kind='stable')[:top_k]
+        combos, counts = combos[most_frequent], counts[most_frequent]
+    import pandas as pd
+    new_index = pd.MultiIndex(levels=[faces] * combos.shape[1], codes=list(combos.T))
+    return pd.DataFrame({'counts': counts}, index=new_index)
+
+
+def _word_counts_frame(words, counts, rolls):
+    '''
+    PURPOSE: Builds word counts dataframe, word as index, counts and frequency columns, most frequent first.
+    '''
+    import pandas as pd
+    word_counts_df = pd.DataFrame({'counts': counts, 'frequency': counts / rolls}, index=pd.Index(words, name='word'))
+    return word_counts_df.sort_values('counts', ascending=False, kind='stable')
+
+
+def _face_totals_frame(faces, face_totals):
+    '''
+    PURPOSE: Builds face totals dataframe, faces as index and counts column.
+    '''
+    import pandas as pd
+    return pd.DataFrame({'counts': face_totals}, index=pd.Index(faces, name='face'))
+
+
+def _face_counts_frame(faces, face_counts):
+    '''
+    PURPOSE: Builds face counts per roll dataframe, roll number as index and faces as columns.
+             Same form as counting faces of each roll with value_counts and fillna(0): a column for each face
+             rolled at least once, and float counts once a roll is missing one of those faces.
+    '''
+    import pandas as pd
+    rolled = face_counts.any(axis=0)
+    faces, face_counts = faces[rolled], face_counts[:, rolled]
+    if (face_counts == 0).any():
+        face_counts = face_counts.astype(float)
+    return pd.DataFrame(face_counts, columns=faces, index=pd.RangeIndex(1, len(face_counts) + 1, name='roll_number'))
+
+
+def _place_values(num_faces, num_cols):
+    '''
+    PURPOSE: Place value of each column when a row of face positions is packed into one integer key
+             (mixed radix, base number of faces). Returns None when keys would overflow int64.
+    '''
+    if num_faces ** num_cols >= 2 ** 63:
+        return None
+    return num_faces ** np.arange(num_cols - 1, -1, -1, dtype=np.int64)
+
+
+def _row_keys(rows, num_faces):
+    '''
+    PURPOSE: Packs each row of face positions into one sortable key, equal rows get equal keys.
+             Keys are int64 mixed radix keys, or raw bytes of each row when those would overflow.
+
+    INPUT- arguments for function
+    rows <- integer matrix of face positions
+    num_faces <- number of faces in face table
+
+    OUTPUT- outputs and attributes
+    keys <- NumPy array with one key per row
+    '''
+    place_values = _place_values(num_faces, rows.shape[1])
+    if place_values is None:
+        rows = np.ascontiguousarray(rows)
+        return rows.view(np.dtype((np.void, rows.dtype.itemsize * rows.shape[1]))).ravel()
+    return rows @ place_values
+
+
+def _unique_rows(rows, num_faces, counts=None):
+    '''
+    PURPOSE: Distinct rows of integer face position matrix with counts, in lexicographic order.
+             Each row is packed into one integer key (mixed radix, base number of faces),
+             so distinct rows are found with a 1-D unique instead of slower np.unique(axis=0).
+
+    INPUT- arguments for function
+    rows <- integer matrix of face positions
+    num_faces <- number of faces in face table
+    counts <- optional NumPy array with count (or probability) of each row, used to merge already counted rows.
+              defaults to 1 per row.
+
+    OUTPUT- outputs and attributes
+    (unique_rows, counts) <- distinct rows as integer matrix and how many times each occurred
+    '''
+    place_values = _place_values(num_faces, rows.shape[1])
+    if place_values is None:
+        #keys would overflow int64, fall back to row-wise unique
+        unique_rows, inverse = np.unique(rows, axis=0, return_inverse=True)
+    else:
+        keys, inverse = np.unique(rows @ place_values, return_inverse=True)
+        unique_rows = ((keys[:, None] // place_values) % num_faces).astype(rows.dtype)
+    if counts is None:
+        counts = np.bincount(inverse.ravel(), minlength=len(unique_rows))
+    else:
+        counts = np.bincount(inverse.ravel(), weights=counts, minlength=len(unique_rows)).astype(counts.dtype)
+    return unique_rows, counts
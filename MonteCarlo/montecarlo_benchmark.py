@@ -0,0 +1,159 @@
+'''
+PURPOSE: Benchmark suite for hot paths of Die, Game and Analyzer classes.
+         Sweeps number of rolls, dice, faces and face dtype (int vs string) over the
+         notebook's coin, six-sided and 26-letter scenarios, and reports per-method latency,
+         rolls per second and peak memory. Results are written as JSON so runs can be compared.
+
+USAGE
+python montecarlo_benchmark.py                                  full sweep, writes montecarlo_benchmark_results.json
+python montecarlo_benchmark.py --quick --output quick.json     small sweep
+python montecarlo_benchmark.py --compare previous.json         full sweep, prints speedup against previous run
+'''
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+from MonteCarlo import Die
+from MonteCarlo import Game
+from MonteCarlo import Analyzer
+
+SCENARIOS = {'coin': ['H', 'T'],
+             'six_sided': ['1', '2', '3', '4', '5', '6'],
+             'letters': list('ABCDEFGHIJKLMNOPQRSTUVWXYZ')}
+FULL_SWEEP = {'rolls': [1000, 10000, 100000, 1000000], 'dice': [2, 5], 'repeats': 3}
+QUICK_SWEEP = {'rolls': [1000, 10000], 'dice': [2, 5], 'repeats': 1}
+
+
+def measure(method, repeats, setup=lambda: None):
+    '''
+    PURPOSE: Calls method repeats times, returns best wall time and peak traced memory of one call.
+             setup runs before every call, outside timing, so calls don't just reuse results cached by previous call.
+
+    INPUT- arguments for function
+    method <- callable taking return value of setup
+    repeats <- number of timed calls
+    setup <- callable with no arguments, defaults to returning None
+
+    OUTPUT- outputs and attributes
+    (seconds, peak_bytes) <- fastest wall time in seconds, peak memory allocated during a call in bytes
+    '''
+    best = float('inf')
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        method(state)
+        best = min(best, time.perf_counter() - start)
+    state = setup()
+    tracemalloc.start()
+    method(state)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak_bytes
+
+
+def bench_case(scenario, face_dtype, num_dice, total_rolls, repeats):
+    '''
+    PURPOSE: Benchmarks every hot path method for one combination of scenario, face dtype, dice and rolls.
+
+    INPUT- arguments for function
+    scenario <- key of SCENARIOS
+    face_dtype <- 'str' for face labels, 'int' for face numbers 1..K
+    num_dice <- number of dice in game
+    total_rolls <- number of rolls in play event
+    repeats <- number of timed calls per method
+
+    OUTPUT- outputs and attributes
+    results <- list of dicts, one per method, with latency, rolls per second and peak memory
+    '''
+    faces = SCENARIOS[scenario]
+    faces = np.array(faces) if face_dtype == 'str' else np.arange(1, len(faces) + 1)
+    die = Die(faces)
+    game = Game([die] * num_dice)
+    game.play(total_rolls, seed=0)
+    #show and Analyzer cache results per play and build dataframes on attribute access:
+    #replay (same seed) or use a fresh Analyzer before each call, and read dataframe inside timed call
+    replay = lambda: game.play(total_rolls, seed=0)
+    fresh_analyzer = lambda: Analyzer(game)
+    methods = {'roll_die': (lambda _: die.roll_die(total_rolls), lambda: None),
+               'play': (lambda _: game.play(total_rolls), lambda: None),
+               'show_wide': (lambda _: game.show('wide'), replay),
+               'show_narrow': (lambda _: game.show('narrow'), replay),
+               'jackpot': (lambda analyzer: (analyzer.jackpot(), analyzer.jackpot_df), fresh_analyzer),
+               'combo': (lambda analyzer: (analyzer.combo(), analyzer.combo_df), fresh_analyzer),
+               'face_counts_per_roll': (lambda analyzer: (analyzer.face_counts_per_roll(), analyzer.face_counts_df),
+                                        fresh_analyzer)}
+    results = []
+    for name, (method, setup) in methods.items():
+        seconds, peak_bytes = measure(method, repeats, setup)
+        results.append({'scenario': scenario, 'face_dtype': face_dtype, 'num_faces': len(faces),
+                        'num_dice': num_dice, 'total_rolls': total_rolls, 'method': name,
+                        'seconds': seconds, 'rolls_per_second': total_rolls / seconds if seconds else None,
+                        'peak_bytes': peak_bytes})
+    return results
+
+
+def run(sweep):
+    '''
+    PURPOSE: Runs benchmark cases for every combination in sweep, printing one line per method.
+
+    INPUT- arguments for function
+    sweep <- dict with lists of 'rolls' and 'dice', and number of 'repeats'
+
+    OUTPUT- outputs and attributes
+    results <- list of result dicts from bench_case
+    '''
+    results = []
+    for scenario in SCENARIOS:
+        for face_dtype in ('int', 'str'):
+            for num_dice in sweep['dice']:
+                for total_rolls in sweep['rolls']:
+                    for result in bench_case(scenario, face_dtype, num_dice, total_rolls, sweep['repeats']):
+                        print('{scenario:>9} {face_dtype:>3} {num_dice:>2} dice {total_rolls:>8} rolls '
+                              '{method:>20}: {seconds:10.6f}s {peak_bytes:>12} bytes'.format(**result))
+                        results.append(result)
+    return results
+
+
+def case_key(result):
+    '''
+    PURPOSE: Returns tuple identifying benchmark case of a result, used to match results across runs.
+    '''
+    return (result['scenario'], result['face_dtype'], result['num_dice'], result['total_rolls'], result['method'])
+
+
+def compare(results, previous_results):
+    '''
+    PURPOSE: Prints speedup (previous time / current time) of each case also present in previous run.
+
+    INPUT- arguments for function
+    results <- list of result dicts of current run
+    previous_results <- list of result dicts loaded from a previous run's JSON file
+    '''
+    previous = {case_key(result): result for result in previous_results}
+    for result in results:
+        if case_key(result) in previous:
+            speedup = previous[case_key(result)]['seconds'] / result['seconds']
+            print('{} {:8.2f}x'.format(' '.join(str(part) for part in case_key(result)), speedup))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Die, Game and Analyzer hot paths.')
+    parser.add_argument('--quick', action='store_true', help='small sweep for a fast check')
+    parser.add_argument('--output', default='montecarlo_benchmark_results.json', help='JSON file to write results to')
+    parser.add_argument('--compare', help='JSON file of a previous run to compare against')
+    args = parser.parse_args()
+    results = run(QUICK_SWEEP if args.quick else FULL_SWEEP)
+    with open(args.output, 'w') as f:
+        json.dump({'python': platform.python_version(), 'numpy': np.__version__,
+                   'machine': platform.machine(), 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'results': results}, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)['results'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+'''
+PURPOSE: asyncio simulation service around Game and RunningAnalyzer classes, for teams asking for
+         jackpot and combination statistics of the same dice again and again.
+         Requests run on a pool of worker processes without blocking the event loop,
+         identical requests in flight at the same time share one run, and finished results
+         are kept in an LRU cache keyed by a canonical hash of faces, weights, rolls and seed.
+
+USAGE
+import asyncio
+from montecarlo_service import SimulationService
+
+async def main():
+    async with SimulationService(workers=4) as service:
+        running = await service.simulate([(['H', 'T'], [1, 1])] * 3, 10**6, seed=1)
+        print(running.jackpot())
+
+asyncio.run(main())
+'''
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from MonteCarlo import Die
+from MonteCarlo import Game
+from MonteCarlo import RunningAnalyzer
+
+
+class SimulationService:
+    '''
+    PURPOSE: Given number of worker processes and cache size, creates SimulationService class object.
+    Plays games for requests of dice configuration, rolls and seed, and returns running statistics
+    (see RunningAnalyzer class). Same seed gives same statistics as Game.play with that seed,
+    so a request is only played once while it stays in cache.
+
+    INPUT
+    workers       number of worker processes
+    cache_size    number of results kept in LRU cache
+
+    OUTPUT
+    SimulationService      SimulationService class object
+    '''
+    def __init__(self, workers=1, cache_size=128):
+        '''
+        PURPOSE: Creates instance of SimulationService class object, with empty cache.
+                 Worker pool is started on first request.
+
+        INPUT- arguments for method
+        workers <- number of worker processes, defaults to 1. None uses every core.
+        cache_size <- number of results kept, least recently used dropped first, defaults to 128.
+
+        OUTPUT- outputs and attributes
+        self.__pool <- private ProcessPoolExecutor, None until first request
+        self.__cache <- private OrderedDict of request key to RunningAnalyzer, least recently used first
+        self.__in_flight <- private dict of request key to future of a run not finished yet
+        self.runs <- public attribute, number of requests played
+        self.hits <- public attribute, number of requests answered from cache
+        self.merged <- public attribute, number of requests that waited for an identical request in flight
+        '''
+        self.__workers = workers or os.cpu_count()
+        self.__cache_size = cache_size
+        self.__pool = None
+        self.__cache = OrderedDict()
+        self.__in_flight = {}
+        self.runs = 0
+        self.hits = 0
+        self.merged = 0
+
+    async def simulate(self, dice, total_rolls, seed, ordered=False):
+        '''
+        PURPOSE: Returns running statistics of a play event for dice configuration, from cache,
+                 from an identical request already in flight, or by playing it on worker pool.
+
+        INPUT- arguments for method
+        dice <- list with one entry per die, each a Die class object or (faces, weights) pair
+        total_rolls <- total rolls of play event
+        seed <- int seed, same seed reproduces same statistics
+        ordered <- defaults to False, combinations count faces in any order. True counts permutations.
+
+        OUTPUT- outputs and attributes
+        Argument Error message <- if dice, total_rolls or seed passed is invalid
+        running_analyzer <- RunningAnalyzer class object of its own for caller, ex. running_analyzer.jackpot()
+        '''
+        try:
+            assert len(dice) > 0, "Dice must have at least one die!"
+            config = [_die_config(die) for die in dice]
+            assert all(len(faces) == len(weights) for faces, weights in config), "Each die needs one weight per face!"
+            assert isinstance(total_rolls, int) and total_rolls > 0, "Total rolls must be a positive int!"
+            assert isinstance(seed, int), "Seed must be an int, results are cached by seed!"
+        except AssertionError as e:
+            print(e)
+            return None
+        key = _request_key(config, total_rolls, seed, ordered)
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+            self.hits += 1
+            return _copy(self.__cache[key], config, ordered)
+        if key in self.__in_flight:
+            self.merged += 1
+        else:
+            if self.__pool is None:
+                self.__pool = ProcessPoolExecutor(max_workers=self.__workers)
+            future = asyncio.get_running_loop().run_in_executor(self.__pool, _simulate, config, total_rolls, seed, ordered)
+            future.add_done_callback(lambda done: self.__finish(key, done))
+            self.__in_flight[key] = future
+            self.runs += 1
+        #shield so a cancelled caller doesn't cancel run shared with other callers
+        return _copy(await asyncio.shield(self.__in_flight[key]), config, ordered)
+
+    def __finish(self, key, future):
+        '''
+        PURPOSE: Moves finished run from in flight to cache, dropping least recently used results over cache_size.
+                 Failed runs aren't cached, their error is raised to each caller waiting on them.
+        '''
+        del self.__in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.__cache[key] = future.result()
+        while len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+
+    def cache_info(self):
+        '''
+        PURPOSE: Returns dict with number of 'runs', cache 'hits', 'merged' requests, 'cached' results and 'in_flight' runs.
+        '''
+        return {'runs': self.runs, 'hits': self.hits, 'merged': self.merged,
+                'cached': len(self.__cache), 'in_flight': len(self.__in_flight)}
+
+    def close(self):
+        '''
+        PURPOSE: Shuts down worker pool, waiting for runs in flight. Cache is kept, pool restarts on next request.
+                 Blocks until runs finish, for synchronous callers. Inside event loop use async with block instead.
+        '''
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+
+    async def __aenter__(self):
+        '''
+        PURPOSE: Returns service for use in async with block, ex. async with SimulationService() as service.
+        '''
+        return self
+
+    async def __aexit__(self, *exc_info):
+        '''
+        PURPOSE: Shuts down worker pool at end of async with block. Waiting for runs in flight
+                 happens in a thread, so event loop isn't blocked.
+        '''
+        pool, self.__pool = self.__pool, None
+        if pool is not None:
+            await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+
+
+def _die_config(die):
+    '''
+    PURPOSE: Returns (faces, weights) NumPy arrays of a Die class object or of a (faces, weights) pair.
+    '''
+    if isinstance(die, Die):
+        #copy weights, change_wt updates them in place
+        return die._faces(), die._weights().copy()
+    faces, weights = die
+    return np.array(faces), np.array(weights, dtype=float)
+
+
+def _request_key(config, total_rolls, seed, ordered):
+    '''
+    PURPOSE: Canonical hash of a request, equal for requests with same faces, weights, rolls, seed and ordered,
+             however their dice were passed. Faces keep their type, so face 1 and face '1' give different keys.
+    '''
+    request = {'dice': [[faces.tolist(), weights.tolist()] for faces, weights in config],
+               'total_rolls': total_rolls, 'seed': seed, 'ordered': bool(ordered)}
+    return hashlib.sha256(json.dumps(request, default=repr).encode()).hexdigest()
+
+
+def _game(config):
+    '''
+    PURPOSE: Builds Game class object from list of (faces, weights) pairs.
+    '''
+    dice = []
+    for faces, weights in config:
+        die = Die(faces)
+        die._set_weights(weights)
+        dice.append(die)
+    return Game(dice)
+
+
+def _simulate(config, total_rolls, seed, ordered):
+    '''
+    PURPOSE: Worker process task, plays request without storing results and returns its RunningAnalyzer.
+    '''
+    return RunningAnalyzer(_game(config), ordered).play(total_rolls, seed)
+
+
+def _copy(running, config, ordered):
+    '''
+    PURPOSE: Returns new RunningAnalyzer with statistics of a cached one, so callers can't change cached results.
+    '''
+    return RunningAnalyzer(_game(config), ordered).merge(running)
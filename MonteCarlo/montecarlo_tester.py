@@ -3,6 +3,15 @@ import numpy as np
 from MonteCarlo import Die
 from MonteCarlo import Game
 from MonteCarlo import Analyzer
+from MonteCarlo import RunningAnalyzer
+from MonteCarlo import WordIndex
+from MonteCarlo import play_batch
+from MonteCarlo import profiler
+from montecarlo_service import SimulationService
+import asyncio
+import subprocess
+import sys
+import tempfile
 import unittest
 
 class MonteCarloTestSuite(unittest.TestCase):
@@ -181,6 +190,439 @@ class MonteCarloTestSuite(unittest.TestCase):
         expected_shape = (20, 6)
         #if test passes below, it is also valid that face_counts_df is a public attribute
         self.assertEqual(analyzer1.face_counts_df.shape, expected_shape)
+
+    def test_14_roll_die(self):
+        '''
+        PURPOSE: Test 14 roll_die method, verifies rolls are returned as NumPy array
+                 and same seed reproduces the same outcomes.
+        '''
+        # uses six_sided Die object
+        rolls_a = six_sided.roll_die(50, seed=7)
+        rolls_b = six_sided.roll_die(50, seed=7)
+        self.assertTrue(isinstance(rolls_a, np.ndarray))
+        self.assertEqual(list(rolls_a), list(rolls_b))
+        
+    def test_15_roll_die(self):
+        '''
+        PURPOSE: Test 15 roll_die method, verifies batch sampling matches requested face distribution.
+                 Weight 0 face should never be rolled.
+        '''
+        coin = Die(np.array(["H", "T", "E"]))
+        coin.change_wt("H", 3)
+        coin.change_wt("E", 0)
+        rolls = coin.roll_die(100000, seed=11)
+        #weights 3:1:0 so heads expected 75% of rolls
+        self.assertAlmostEqual(np.mean(rolls == "H"), 0.75, places=2)
+        self.assertTrue("E" not in rolls)
+
+    def test_16_change_wt(self):
+        '''
+        PURPOSE: Test 16 change_wt method, verifies cached sampling table is reused until a weight changes,
+                 and rebuilt with new normalized probabilities after change_wt.
+        '''
+        coin = Die(np.array(["H", "T"]))
+        table = coin._sampling_table()
+        self.assertTrue(coin._sampling_table() is table)
+        coin.change_wt("T", 3)
+        self.assertEqual(list(coin._sampling_table()[0]), [0.25, 0.75])
+
+    def test_17_play(self):
+        '''
+        PURPOSE: Test 17 play method, verifies play results stored as smallest unsigned integer matrix
+                 and 'wide' form built with categorical face columns. Same seed reproduces same play.
+        '''
+        letters = Die(np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")))
+        game_letters = Game([letters]*5)
+        game_letters.play(100, seed=3)
+        results, faces = game_letters._results()
+        self.assertEqual((results.dtype, results.shape, len(faces)), (np.uint8, (100, 5), 26))
+        wide_df = game_letters.show('wide')
+        self.assertTrue(all(str(dtype) == 'category' for dtype in wide_df.dtypes))
+        game_letters.play(100, seed=3)
+        self.assertTrue(wide_df.equals(game_letters.show('wide')))
+
+    def test_18_combo(self):
+        '''
+        PURPOSE: Test 18 vectorized Analyzer methods, verifies combo counts match counting sorted
+                 face tuples row by row, and jackpot/face counts agree with wide form play results.
+        '''
+        coins = Game([Die(np.array(["H", "T"]))]*4)
+        coins.play(500, seed=5)
+        coins_analyzer = Analyzer(coins)
+        coins_analyzer.combo()
+        expected = pd.Series([tuple(sorted(row)) for row in coins.show().astype(str).values]).value_counts()
+        self.assertEqual({combo: count for combo, count in coins_analyzer.combo_df['counts'].items()},
+                         expected.to_dict())
+        wide_df = coins.show().astype(str)
+        self.assertEqual(coins_analyzer.jackpot(), int((wide_df.nunique(axis=1) == 1).sum()))
+        coins_analyzer.face_counts_per_roll()
+        self.assertEqual(list(coins_analyzer.face_counts_df['H']), list((wide_df == "H").sum(axis=1)))
+
+    def test_19_play_chunks(self):
+        '''
+        PURPOSE: Test 19 play_chunks method, verifies streamed chunks have requested size
+                 and together match play results for the same seed, and chunk_size not above 0
+                 prints a message and yields nothing instead of looping forever.
+        '''
+        global coins_game
+        coins_game = Game([Die(np.array(["H", "T"]))]*3)
+        chunks = list(coins_game.play_chunks(100000, chunk_size=30000, seed=8))
+        self.assertEqual([len(chunk) for chunk in chunks], [30000, 30000, 30000, 10000])
+        coins_game.play(100000, seed=8)
+        self.assertTrue(np.array_equal(np.concatenate(chunks), coins_game._results()[0]))
+        self.assertEqual(list(coins_game.play_chunks(100, chunk_size=0)), [])
+        self.assertEqual(list(coins_game.play_chunks(100, chunk_size=-5)), [])
+        
+    def test_20_running_analyzer(self):
+        '''
+        PURPOSE: Test 20 RunningAnalyzer class, verifies jackpot, combo and face totals computed over
+                 streamed chunks, and merged from separate RunningAnalyzers, match Analyzer on play results.
+        '''
+        coins_analyzer = Analyzer(coins_game)
+        coins_analyzer.combo()
+        coins_analyzer.face_counts_per_roll()
+        running = RunningAnalyzer(coins_game).consume(coins_game.play_chunks(100000, chunk_size=7000, seed=8))
+        running.combo()
+        running.face_totals()
+        self.assertEqual((running.rolls, running.jackpot()), (100000, coins_analyzer.jackpot()))
+        self.assertTrue(running.combo_df.equals(coins_analyzer.combo_df))
+        self.assertEqual(list(running.face_totals_df['counts']), list(coins_analyzer.face_counts_df.sum()))
+        merged = RunningAnalyzer(coins_game)
+        for chunk in coins_game.play_chunks(100000, chunk_size=40000, seed=8):
+            merged.merge(RunningAnalyzer(coins_game).update(chunk))
+        merged.combo()
+        self.assertTrue(merged.combo_df.equals(coins_analyzer.combo_df))
+
+    def test_21_play(self):
+        '''
+        PURPOSE: Test 21 play method with worker processes, verifies play results for a seed
+                 are identical whatever the number of workers.
+        '''
+        coins_game.play(200000, seed=21)
+        serial_results = coins_game._results()[0]
+        coins_game.play(200000, seed=21, workers=2)
+        self.assertTrue(np.array_equal(serial_results, coins_game._results()[0]))
+        
+    def test_22_play_batch(self):
+        '''
+        PURPOSE: Test 22 play_batch function, verifies running statistics reduced across workers
+                 are identical whatever the number of workers, and each game gets its own stream.
+        '''
+        serial = play_batch([coins_game, game_1], 150000, seed=22)
+        pooled = play_batch([coins_game, game_1], 150000, seed=22, workers=3)
+        for serial_analyzer, pooled_analyzer in zip(serial, pooled):
+            serial_analyzer.combo()
+            pooled_analyzer.combo()
+            self.assertEqual(serial_analyzer.jackpot(), pooled_analyzer.jackpot())
+            self.assertTrue(serial_analyzer.combo_df.equals(pooled_analyzer.combo_df))
+        self.assertEqual([analyzer.rolls for analyzer in pooled], [150000, 150000])
+
+    def test_23_jackpot_probability(self):
+        '''
+        PURPOSE: Test 23 exact probability methods, verifies jackpot and combination probabilities of
+                 three fair coins (1/4 jackpot, 3/8 two heads one tail), and expected counts of each combination.
+        '''
+        self.assertAlmostEqual(coins_game.jackpot_probability(), 0.25)
+        self.assertAlmostEqual(coins_game.combo_probability(["T", "H", "H"]), 0.375)
+        combo_probs_df = coins_game.combo_probabilities(800)
+        self.assertEqual(list(combo_probs_df['expected_counts']), [100.0, 300.0, 300.0, 100.0])
+        
+    def test_24_combo_probabilities(self):
+        '''
+        PURPOSE: Test 24 combo_probabilities method, verifies exact probabilities of unfair dice
+                 agree with combo_probability method and with combination frequencies of a large play event.
+        '''
+        unfair = Die(np.array(["H", "T"]))
+        unfair.change_wt("H", 4)
+        unfair_game = Game([unfair, Die(np.array(["H", "T"])), unfair])
+        combo_probs_df = unfair_game.combo_probabilities()
+        self.assertAlmostEqual(combo_probs_df.loc[("H", "H", "T"), 'probability'],
+                               unfair_game.combo_probability(["H", "T", "H"]))
+        unfair_game.play(200000, seed=24)
+        unfair_analyzer = Analyzer(unfair_game)
+        unfair_analyzer.combo()
+        frequencies = unfair_analyzer.combo_df['counts'] / 200000
+        self.assertTrue(np.allclose(frequencies, combo_probs_df['probability'], atol=0.005))
+
+    def test_25_combo(self):
+        '''
+        PURPOSE: Test 25 Analyzer caching, verifies repeated calls on same play event reuse computed results,
+                 a new play event invalidates them, and play results can't be modified through Analyzer.
+        '''
+        coins_analyzer = Analyzer(coins_game)
+        coins_analyzer.combo()
+        first_combo_df = coins_analyzer.combo_df
+        coins_analyzer.combo()
+        self.assertTrue(coins_analyzer.combo_df is first_combo_df)
+        generation = coins_game.generation
+        coins_game.play(10, seed=25)
+        self.assertEqual(coins_game.generation, generation + 1)
+        coins_analyzer.combo()
+        self.assertEqual(coins_analyzer.combo_df['counts'].sum(), 10)
+        self.assertFalse(coins_game._results()[0].flags.writeable)
+
+    def test_26_save(self):
+        '''
+        PURPOSE: Test 26 save and load methods, verifies saved game reopens memory-mapped with same
+                 dice weights and play results, and Analyzer/RunningAnalyzer over it match original game.
+                 Also verifies a play seeded with a sequence of ints loads back with same seed.
+        '''
+        with tempfile.TemporaryDirectory() as path:
+            game_1.play(5000, seed=26)
+            game_1.save(path)
+            loaded_game = Game.load(path)
+            loaded_results = loaded_game._results()[0]
+            self.assertTrue(isinstance(loaded_results, np.memmap))
+            self.assertTrue(np.array_equal(loaded_results, game_1._results()[0]))
+            self.assertTrue(np.allclose(loaded_game._face_probs(), game_1._face_probs()))
+            running = RunningAnalyzer(loaded_game).consume(loaded_game.results_chunks(1000))
+            self.assertEqual(running.jackpot(), Analyzer(game_1).jackpot())
+            self.assertEqual(Analyzer(loaded_game).jackpot(), Analyzer(game_1).jackpot())
+        with tempfile.TemporaryDirectory() as path:
+            #seed given as sequence of ints saves and loads back
+            game_1.play(100, seed=[1, 2])
+            game_1.save(path)
+            self.assertEqual(Game.load(path)._Game__seed_seq.entropy, [1, 2])
+
+    def test_27_show(self):
+        '''
+        PURPOSE: Test 27 show method, verifies 'narrow' form matches reshaping 'wide' form with melt,
+                 is reused until next play, and as_arrays option returns same values as plain arrays.
+        '''
+        game_1.play(30, seed=27)
+        narrow_df = game_1.show('narrow')
+        melted = game_1.show('wide').reset_index().melt(id_vars='roll_number', var_name='die_number',
+                                                       value_name='face_rolled')
+        self.assertEqual(list(narrow_df.index), list(zip(melted['roll_number'], melted['die_number'])))
+        self.assertEqual(list(narrow_df['face_rolled']), list(melted['face_rolled']))
+        self.assertTrue(game_1.show('narrow') is narrow_df)
+        roll_number, die_number, face_rolled = game_1.show('narrow', as_arrays=True)
+        self.assertEqual(list(face_rolled), list(narrow_df['face_rolled']))
+        game_1.play(30, seed=28)
+        self.assertFalse(game_1.show('narrow') is narrow_df)
+
+    def test_28_word_matches(self):
+        '''
+        PURPOSE: Test 28 word_matches method and WordIndex class, verifies rolls spelling a word are counted
+                 per word in die order, words that can't be rolled are skipped, and streamed counts match.
+        '''
+        letters_game = Game([Die(np.array(list("ABC")))]*3)
+        letters_game.play(2000, seed=28)
+        rolled = ["".join(row) for row in letters_game.show('wide', as_arrays=True)]
+        letters_analyzer = Analyzer(letters_game)
+        matches = letters_analyzer.word_matches(["CAB", "BAA", "ABCD", "XYZ"])
+        self.assertEqual(matches, rolled.count("CAB") + rolled.count("BAA"))
+        self.assertEqual(letters_analyzer.word_matches_df.loc["CAB", 'counts'], rolled.count("CAB"))
+        word_index = WordIndex(letters_game, ["CAB", "BAA"]).consume(letters_game.play_chunks(2000, 300, seed=28))
+        self.assertEqual((word_index.matches(), word_index.rolls), (matches, 2000))
+
+    def test_29_combo(self):
+        '''
+        PURPOSE: Test 29 combo method options, verifies ordered (permutation) counts, exact top_k,
+                 and approximate counts with capacity stay within reported error of exact counts.
+        '''
+        unfair = Die(np.array(list("ABCDEF")))
+        unfair.change_wt("A", 6)
+        unfair_game = Game([unfair]*3)
+        unfair_game.play(100000, seed=29)
+        rolled = pd.Series(["".join(row) for row in unfair_game.show('wide', as_arrays=True)]).value_counts()
+        unfair_analyzer = Analyzer(unfair_game)
+        unfair_analyzer.combo(ordered=True, top_k=3)
+        self.assertEqual(["".join(combo) for combo in unfair_analyzer.combo_df.index], list(rolled.index[:3]))
+        self.assertEqual(list(unfair_analyzer.combo_df['counts']), list(rolled.iloc[:3]))
+        unfair_analyzer.combo()
+        exact = unfair_analyzer.combo_df['counts']
+        unfair_analyzer.combo(top_k=5, capacity=20)
+        approximate = unfair_analyzer.combo_df['counts']
+        self.assertTrue(len(approximate) == 5 and unfair_analyzer.combo_error > 0)
+        for combo, count in approximate.items():
+            self.assertTrue(count <= exact[combo] <= count + unfair_analyzer.combo_error)
+
+    def test_30_estimate(self):
+        '''
+        PURPOSE: Test 30 estimate method, verifies play stops once interval is narrower than target,
+                 interval covers exact rate, and max_rolls stops play that can't converge.
+        '''
+        jackpot_estimate = coins_game.estimate('jackpot', target_width=0.01, batch_size=5000, seed=30)
+        low, high = jackpot_estimate['interval']
+        self.assertTrue(jackpot_estimate['converged'] and high - low <= 0.01 and low <= 0.25 <= high)
+        self.assertTrue(jackpot_estimate['rolls'] < 50000)
+        combo_estimate = coins_game.estimate('combo', rel_error=0.02, combo=["H", "T", "T"], seed=30)
+        low, high = combo_estimate['interval']
+        self.assertTrue(low <= 0.375 <= high)
+        face_estimate = coins_game.estimate('face', target_width=1e-6, face="H", batch_size=1000, max_rolls=3000)
+        self.assertEqual((face_estimate['converged'], face_estimate['rolls']), (False, 3000))
+        self.assertIsNone(coins_game.estimate(rel_error=0.1, max_rolls=0))
+        self.assertIsNone(coins_game.estimate(rel_error=0.1, confidence=1.5))
+        self.assertIsNone(coins_game.estimate(target_width=0.1, batch_size=0))
+
+    def test_31_rare_estimate(self):
+        '''
+        PURPOSE: Test 31 rare_estimate method, verifies importance sampling estimates of a jackpot and a combination
+                 too rare for plain play (ten 26-letter dice) are within their confidence interval of exact probability.
+        '''
+        letters = Die(np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")))
+        letters.change_wt("A", 3)
+        letters_game = Game([letters]*10)
+        jackpot_estimate = letters_game.rare_estimate('jackpot', total_rolls=50000, seed=31)
+        low, high = jackpot_estimate['interval']
+        self.assertTrue(low <= letters_game.jackpot_probability() <= high)
+        self.assertTrue(jackpot_estimate['hits'] > 0 and jackpot_estimate['std_error'] > 0)
+        combo = list("AABBCDEFGH")
+        combo_estimate = letters_game.rare_estimate('combo', combo=combo, total_rolls=50000, tilt=0.8, seed=31)
+        low, high = combo_estimate['interval']
+        self.assertTrue(low <= letters_game.combo_probability(combo) <= high)
+        self.assertIsNone(letters_game.rare_estimate(total_rolls=0))
+        self.assertIsNone(letters_game.rare_estimate(confidence=1.5))
+
+    def test_32_profiler(self):
+        '''
+        PURPOSE: Test 32 profiler, verifies nothing is recorded while disabled, and while enabled calls, rows and bytes
+                 per method are recorded and each call record is passed to hooks.
+        '''
+        profiler.reset()
+        coins_game.play(1000, seed=32)
+        self.assertEqual(len(profiler.stats()), 0)
+        records = []
+        profiler.add_hook(records.append)
+        profiler.enable()
+        try:
+            coins_game.play(1000, seed=32)
+            coins_analyzer = Analyzer(coins_game)
+            coins_analyzer.jackpot()
+            coins_analyzer.jackpot()
+        finally:
+            profiler.disable()
+            profiler.remove_hook(records.append)
+        stats = profiler.stats()
+        self.assertEqual(stats.loc['Game.play', ['calls', 'rows', 'bytes']].tolist(), [1, 1000, 3000])
+        self.assertEqual(stats.loc['Die._roll_codes', 'calls'], 3)
+        self.assertEqual(stats.loc['Analyzer.jackpot', ['calls', 'rows']].tolist(), [2, 2000])
+        self.assertEqual(len(records), stats['calls'].sum())
+        self.assertEqual(set(records[0]), {'method', 'seconds', 'rows', 'bytes'})
+        profiler.reset()
+
+    def test_33_lazy_pandas(self):
+        '''
+        PURPOSE: Test 33 lazy pandas import, verifies in a fresh process that importing package, playing and
+                 computing statistics doesn't import pandas, and that pandas is imported once a dataframe is used.
+        '''
+        script = ("import sys\n"
+                  "from MonteCarlo import Die, Game, Analyzer\n"
+                  "game = Game([Die(['H', 'T'])] * 3)\n"
+                  "game.play(1000, seed=33)\n"
+                  "analyzer = Analyzer(game)\n"
+                  "analyzer.jackpot(); analyzer.combo(); analyzer.face_counts_per_roll()\n"
+                  "game.show(as_arrays=True)\n"
+                  "print('pandas' in sys.modules)\n"
+                  "analyzer.combo_df\n"
+                  "print('pandas' in sys.modules)\n")
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_34_simulation_service(self):
+        '''
+        PURPOSE: Test 34 SimulationService, verifies identical requests in flight share one run, repeated requests
+                 are answered from cache whether dice are passed as Die objects or (faces, weights) pairs,
+                 and statistics match Analyzer on Game.play with same seed.
+        '''
+        coin = Die(np.array(["H", "T"]))
+        coin.change_wt("H", 3)
+        async def requests():
+            async with SimulationService(workers=2, cache_size=2) as service:
+                merged = await asyncio.gather(*[service.simulate([coin]*3, 10000, seed=34) for _ in range(3)])
+                cached = await service.simulate([(["H", "T"], [3, 1])]*3, 10000, seed=34)
+                return merged, cached, service.cache_info()
+        merged, cached, info = asyncio.run(requests())
+        self.assertEqual((info['runs'], info['merged'], info['hits']), (1, 2, 1))
+        coins_3 = Game([coin]*3)
+        coins_3.play(10000, seed=34)
+        self.assertEqual({running.jackpot() for running in merged + [cached]}, {Analyzer(coins_3).jackpot()})
+        self.assertFalse(merged[0] is merged[1])
+
+    def test_35_running_analyzer(self):
+        '''
+        PURPOSE: Test 35 RunningAnalyzer play with capacity, verifies approximate combination counts and their error
+                 are same for same seed whatever the number of workers, and same as Analyzer.combo on same rolls.
+        '''
+        letters = Die(np.array(list("ABCDEFGHIJ")))
+        letters.change_wt("A", 3)
+        letters_game = Game([letters]*3)
+        running_frames = []
+        for workers in (1, 3):
+            running = RunningAnalyzer(letters_game, capacity=15).play(500000, seed=35, workers=workers)
+            running.combo()
+            running_frames.append((running.combo_error, running.combo_df))
+        self.assertTrue(running_frames[0][0] > 0)
+        self.assertEqual(running_frames[0][0], running_frames[1][0])
+        self.assertTrue(running_frames[0][1].equals(running_frames[1][1]))
+        letters_game.play(500000, seed=35)
+        letters_analyzer = Analyzer(letters_game)
+        letters_analyzer.combo(capacity=15)
+        self.assertEqual(letters_analyzer.combo_error, running_frames[0][0])
+        self.assertTrue(letters_analyzer.combo_df.equals(running_frames[0][1]))
+
+    def test_36_simulation_service(self):
+        '''
+        PURPOSE: Test 36 SimulationService async with block, verifies event loop keeps running
+                 while end of block waits for a run still in flight, and the run finishes.
+        '''
+        async def exit_in_flight():
+            ticks = []
+            async def heartbeat():
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks.append(1)
+            service = SimulationService()
+            running = asyncio.ensure_future(service.simulate([(["H", "T"], [1, 1])]*3, 2000000, seed=36))
+            await asyncio.sleep(0)
+            in_flight = service.cache_info()['in_flight']
+            beat = asyncio.ensure_future(heartbeat())
+            await service.__aexit__(None, None, None)
+            beat.cancel()
+            return in_flight, len(ticks), (await running).rolls
+        in_flight, ticks, rolls = asyncio.run(exit_in_flight())
+        self.assertEqual((in_flight, rolls), (1, 2000000))
+        self.assertTrue(ticks > 0)
+
+    def test_37_change_wt(self):
+        '''
+        PURPOSE: Test 37 change_wt method and weight checks, verifying negative, nan and infinite weights
+                 are rejected with a message and weights stay unchanged, and rolling a die whose weights
+                 sum to 0 or were set negative (ex. by Game.load) raises ValueError instead of rolling uniformly.
+
+                 Incorrect entry message: "New Weight must be finite and not negative!"
+        '''
+        coin = Die(np.array(["H", "T"]))
+        coin.change_wt("T", -0.5)
+        coin.change_wt("T", "nan")
+        coin.change_wt("T", float("inf"))
+        self.assertEqual(list(coin.current_die()['weights']), [1.0, 1.0])
+        coin.change_wt("H", 0)
+        coin.change_wt("T", 0)
+        with self.assertRaises(ValueError):
+            coin.roll_die(10)
+        with self.assertRaises(ValueError):
+            Game([coin]*2).jackpot_probability()
+        loaded_coin = Die(np.array(["H", "T"]))
+        loaded_coin._set_weights([2.0, -1.0])
+        with self.assertRaises(ValueError):
+            Game([loaded_coin]*2).play(10)
+
+    def test_38_face_counts_per_roll(self):
+        '''
+        PURPOSE: Test 38 face_counts_per_roll method, verifies dataframe has same form as counting faces of each roll
+                 with value_counts and fillna(0): columns only for faces rolled, float counts.
+        '''
+        letters_game = Game([Die(np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")))]*2)
+        letters_game.play(20, seed=38)
+        letters_analyzer = Analyzer(letters_game)
+        letters_analyzer.face_counts_per_roll()
+        rolled = pd.DataFrame(letters_game.show('wide', as_arrays=True),
+                              index=pd.RangeIndex(1, 21, name='roll_number'))
+        expected = rolled.apply(pd.Series.value_counts, axis=1).fillna(0)
+        self.assertTrue(len(expected.columns) < 26)
+        pd.testing.assert_frame_equal(letters_analyzer.face_counts_df, expected)
         
         
 if __name__ == '__main__':
@@ -198,4 +640,29 @@ if __name__ == '__main__':
     suite.addTest(MonteCarloTestSuite('test_11_jackpot'))
     suite.addTest(MonteCarloTestSuite('test_12_combo'))
     suite.addTest(MonteCarloTestSuite('test_13_face_counts_per_roll'))
+    suite.addTest(MonteCarloTestSuite('test_14_roll_die'))
+    suite.addTest(MonteCarloTestSuite('test_15_roll_die'))
+    suite.addTest(MonteCarloTestSuite('test_16_change_wt'))
+    suite.addTest(MonteCarloTestSuite('test_17_play'))
+    suite.addTest(MonteCarloTestSuite('test_18_combo'))
+    suite.addTest(MonteCarloTestSuite('test_19_play_chunks'))
+    suite.addTest(MonteCarloTestSuite('test_20_running_analyzer'))
+    suite.addTest(MonteCarloTestSuite('test_21_play'))
+    suite.addTest(MonteCarloTestSuite('test_22_play_batch'))
+    suite.addTest(MonteCarloTestSuite('test_23_jackpot_probability'))
+    suite.addTest(MonteCarloTestSuite('test_24_combo_probabilities'))
+    suite.addTest(MonteCarloTestSuite('test_25_combo'))
+    suite.addTest(MonteCarloTestSuite('test_26_save'))
+    suite.addTest(MonteCarloTestSuite('test_27_show'))
+    suite.addTest(MonteCarloTestSuite('test_28_word_matches'))
+    suite.addTest(MonteCarloTestSuite('test_29_combo'))
+    suite.addTest(MonteCarloTestSuite('test_30_estimate'))
+    suite.addTest(MonteCarloTestSuite('test_31_rare_estimate'))
+    suite.addTest(MonteCarloTestSuite('test_32_profiler'))
+    suite.addTest(MonteCarloTestSuite('test_33_lazy_pandas'))
+    suite.addTest(MonteCarloTestSuite('test_34_simulation_service'))
+    suite.addTest(MonteCarloTestSuite('test_35_running_analyzer'))
+    suite.addTest(MonteCarloTestSuite('test_36_simulation_service'))
+    suite.addTest(MonteCarloTestSuite('test_37_change_wt'))
+    suite.addTest(MonteCarloTestSuite('test_38_face_counts_per_roll'))
     unittest.TextTestRunner(verbosity=3).run(suite)
\ No newline at end of file
@@ -8,5 +8,5 @@ setup(
     author_email='etc7fq@virginia.edu',
     description='MonteCarlo Project Module',
     packages=find_packages(),    
-    install_requires=['numpy >= 1.11.1', 'matplotlib >= 1.5.1'],
+    install_requires=['numpy >= 1.17', 'pandas >= 1.0', 'matplotlib >= 1.5.1'],
 )
\ No newline at end of file